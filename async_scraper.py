@@ -0,0 +1,154 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup
+
+
+ASYNC_HTTP_BACKENDS = ["httpx", "aiohttp"]
+
+
+class AsyncHttpClient:
+    def __init__(self, backend: Optional[str] = None, max_connections: int = 20, max_connections_per_host: int = 4,
+                 timeout: float = 15.0, headers: Optional[Dict[str, str]] = None):
+        self.backend = backend or self._detect_backend()
+        if self.backend not in ASYNC_HTTP_BACKENDS:
+            raise ValueError(f"Unsupported async HTTP backend: {self.backend}. Available: {ASYNC_HTTP_BACKENDS}")
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.headers = headers or {}
+        self._client = None
+        self._lock = asyncio.Lock()
+        self._host_slots = {}
+
+        if self.backend == "httpx":
+            import httpx
+            self.errors = (httpx.HTTPError, asyncio.TimeoutError)
+        else:
+            import aiohttp
+            self.errors = (aiohttp.ClientError, asyncio.TimeoutError)
+
+    @staticmethod
+    def get_available_backends() -> List[str]:
+        available = []
+        for backend in ASYNC_HTTP_BACKENDS:
+            try:
+                __import__(backend)
+                available.append(backend)
+            except ImportError:
+                continue
+        return available
+
+    def _detect_backend(self) -> str:
+        available = self.get_available_backends()
+        if not available:
+            raise ImportError("Async scraping requires httpx or aiohttp: pip install httpx")
+        return available[0]
+
+    async def _get_client(self):
+        async with self._lock:
+            if self._client is None:
+                if self.backend == "httpx":
+                    import httpx
+                    limits = httpx.Limits(max_connections=self.max_connections,
+                                          max_keepalive_connections=self.max_connections)
+                    self._client = httpx.AsyncClient(headers=self.headers, limits=limits, timeout=self.timeout,
+                                                     follow_redirects=True)
+                else:
+                    import aiohttp
+                    connector = aiohttp.TCPConnector(limit=self.max_connections,
+                                                     limit_per_host=self.max_connections_per_host)
+                    self._client = aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                                         timeout=aiohttp.ClientTimeout(total=self.timeout))
+            return self._client
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_slots[host]
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes, Dict[str, str]]:
+        client = await self._get_client()
+        if self.backend == "httpx":
+            async with self._host_slot(url):
+                response = await client.get(url, headers=headers)
+            return response.status_code, response.content, dict(response.headers)
+        async with client.get(url, headers=headers) as response:
+            return response.status, await response.read(), dict(response.headers)
+
+    async def close(self):
+        async with self._lock:
+            if self._client is not None:
+                if self.backend == "httpx":
+                    await self._client.aclose()
+                else:
+                    await self._client.close()
+                self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+
+class AsyncBaseScraper:
+    def __init__(self, scraper, client: AsyncHttpClient, executor: Optional[Executor] = None,
+                 request_timeout: float = 15.0):
+        self.scraper = scraper
+        self.source_name = scraper.source_name
+        self.client = client
+        self.executor = executor
+        self.request_timeout = request_timeout
+
+    async def fetch_content(self, url: str) -> Optional[bytes]:
+        http_cache = self.scraper.http_cache
+        loop = asyncio.get_running_loop()
+        headers = {}
+        if http_cache:
+            cached, headers = await loop.run_in_executor(self.executor, http_cache.conditional_request,
+                                                         self.source_name, url)
+            if cached is not None:
+                return cached
+
+        delay = self.scraper.rate_limiter.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            status, content, response_headers = await asyncio.wait_for(self.client.get(url, headers),
+                                                                       self.request_timeout)
+        except asyncio.TimeoutError:
+            print(f"Timed out fetching {self.source_name} after {self.request_timeout}s")
+            return None
+        except self.client.errors as e:
+            print(f"Error fetching {self.source_name}: {e}")
+            return None
+
+        if http_cache:
+            content = await loop.run_in_executor(self.executor, http_cache.resolve_response, self.source_name, url,
+                                                 status, response_headers, content)
+        elif status != 200:
+            content = None
+        if content is None:
+            print(f"Failed to retrieve {self.source_name}: {status}")
+        return content
+
+    async def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        content = await self.fetch_content(url)
+        if content is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.scraper.parse_page, content)
+
+    async def fetch_pages(self, urls: List[str]) -> List[Optional[BeautifulSoup]]:
+        return list(await asyncio.gather(*(self.fetch_page(url) for url in urls)))
+
+    async def scrape_news(self) -> Dict[str, List[str]]:
+        contents = await asyncio.gather(*(self.fetch_content(url) for url in self.scraper.get_page_urls()))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.scraper.extract_contents, list(contents))
+
+    async def get_news_with_metadata(self) -> Dict[str, any]:
+        return self.scraper.wrap_metadata(await self.scrape_news())
@@ -0,0 +1,110 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import queue
+import threading
+import time
+import numpy as np
+
+
+STREAM_CHUNK_BATCHES = 32
+
+
+class LengthBucketScheduler:
+    def __init__(self, batch_size: int = 32, max_length: int = 512):
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.real_tokens = 0
+        self.padded_tokens = 0
+        self.total_batches = 0
+
+    def schedule(self, lengths: List[int], batch_size: Optional[int] = None) -> List[Tuple[List[int], int]]:
+        batch_size = batch_size or self.batch_size
+        order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+
+        batches = []
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            padded_length = min(max(lengths[i] for i in indices), self.max_length)
+            batches.append((indices, padded_length))
+
+            self.real_tokens += sum(min(lengths[i], padded_length) for i in indices)
+            self.padded_tokens += padded_length * len(indices)
+            self.total_batches += 1
+
+        return batches
+
+    def get_padding_stats(self) -> Dict[str, float]:
+        wasted_tokens = self.padded_tokens - self.real_tokens
+        efficiency = self.real_tokens / self.padded_tokens if self.padded_tokens > 0 else 1.0
+        return {
+            "batches": self.total_batches,
+            "real_tokens": self.real_tokens,
+            "padded_tokens": self.padded_tokens,
+            "wasted_tokens": wasted_tokens,
+            "padding_efficiency": efficiency
+        }
+
+
+def pad_token_ids(input_ids: List[List[int]], padded_length: int, pad_token_id: int) -> Tuple[np.ndarray, np.ndarray]:
+    ids = np.full((len(input_ids), padded_length), pad_token_id, dtype=np.int64)
+    attention_mask = np.zeros((len(input_ids), padded_length), dtype=np.int64)
+
+    for row, sequence in enumerate(input_ids):
+        sequence = sequence[:padded_length]
+        ids[row, :len(sequence)] = sequence
+        attention_mask[row, :len(sequence)] = 1
+
+    return ids, attention_mask
+
+
+class BackgroundPrefetcher:
+    def __init__(self, items: Iterable, depth: int = 2, name: str = "sentiment-prefetch"):
+        self.stall_seconds = 0.0
+        self._queue = queue.Queue(maxsize=max(1, depth))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(iter(items),), name=name, daemon=True)
+        self._thread.start()
+
+    def _put(self, entry) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, items: Iterator):
+        try:
+            for item in items:
+                if not self._put(("item", item)):
+                    return
+        except BaseException as e:
+            self._put(("error", e))
+            return
+        self._put(("done", None))
+
+    def __iter__(self):
+        try:
+            while True:
+                start = time.perf_counter()
+                kind, value = self._queue.get()
+                self.stall_seconds += time.perf_counter() - start
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            self.close()
+
+    def close(self):
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join()
@@ -0,0 +1,90 @@
+from typing import Dict, List, Optional, Tuple
+import zlib
+import numpy as np
+from scipy import sparse
+from scipy.special import softmax
+from financial_lexicon import FinancialLexicon
+from headline_dedup import normalize_headline
+
+
+class HashedLinearClassifier:
+    def __init__(self, num_features: int = 1 << 14, num_classes: int = 3):
+        self.num_features = num_features
+        self.num_classes = num_classes
+        self.weights = np.zeros((num_features, num_classes))
+        self.bias = np.zeros(num_classes)
+
+    def _features(self, texts: List[str]) -> sparse.csr_matrix:
+        rows, columns = [], []
+        for row, text in enumerate(texts):
+            words = normalize_headline(text).split()
+            tokens = set(words) | {f"{first} {second}" for first, second in zip(words, words[1:])}
+            for token in tokens:
+                rows.append(row)
+                columns.append(zlib.crc32(token.encode("utf-8")) % self.num_features)
+        values = np.ones(len(rows))
+        return sparse.csr_matrix((values, (rows, columns)), shape=(len(texts), self.num_features))
+
+    def fit(self, texts: List[str], label_ids: np.ndarray, epochs: int = 200, learning_rate: float = 0.5,
+            l2: float = 1e-4) -> "HashedLinearClassifier":
+        features = self._features(texts)
+        targets = np.eye(self.num_classes)[np.asarray(label_ids)]
+
+        for _ in range(epochs):
+            probabilities = softmax(features @ self.weights + self.bias, axis=1)
+            error = (probabilities - targets) / len(texts)
+            self.weights -= learning_rate * (features.T @ error + l2 * self.weights)
+            self.bias -= learning_rate * error.sum(axis=0)
+        return self
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        return softmax(self._features(texts) @ self.weights + self.bias, axis=1)
+
+    def save(self, path: str):
+        np.savez_compressed(path, weights=self.weights, bias=self.bias)
+
+    @classmethod
+    def load(cls, path: str) -> "HashedLinearClassifier":
+        data = np.load(path)
+        classifier = cls(num_features=data["weights"].shape[0], num_classes=data["weights"].shape[1])
+        classifier.weights = data["weights"]
+        classifier.bias = data["bias"]
+        return classifier
+
+
+class LexiconCascade:
+    def __init__(self, lexicon: FinancialLexicon, threshold: float = 0.7, smoothing: float = 0.5,
+                 linear_model: Optional[HashedLinearClassifier] = None):
+        self.lexicon = lexicon
+        self.threshold = threshold
+        self.smoothing = smoothing
+        self.linear_model = linear_model
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.texts_seen = 0
+        self.decided = 0
+
+    def score(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        counts = self.lexicon.count_matrix(texts)
+        probabilities = (counts + self.smoothing) / (counts.sum(axis=1, keepdims=True) + self.smoothing * counts.shape[1])
+        if self.linear_model is not None:
+            probabilities = (probabilities + self.linear_model.predict_proba(texts)) / 2
+        return probabilities, probabilities.max(axis=1)
+
+    def route(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        probabilities, confidence = self.score(texts)
+        decided = confidence >= self.threshold
+        self.texts_seen += len(texts)
+        self.decided += int(decided.sum())
+        return decided, probabilities
+
+    def get_stats(self) -> Dict[str, float]:
+        routed = self.texts_seen - self.decided
+        return {
+            "threshold": self.threshold,
+            "texts": self.texts_seen,
+            "decided_by_first_stage": self.decided,
+            "routed_to_transformer": routed,
+            "routing_ratio": routed / self.texts_seen if self.texts_seen > 0 else 0.0
+        }
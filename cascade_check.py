@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+from enhanced_sentiment import EnhancedSentimentAnalyzer
+from inference_backends import BackendFactory
+from cascade import HashedLinearClassifier
+from precision_check import AGREEMENT_CORPUS
+from sentiment_batch import ERROR_LABEL_ID
+
+
+def load_corpus(path: Optional[str] = None) -> List[str]:
+    if not path:
+        return list(AGREEMENT_CORPUS)
+    with open(path, encoding="utf-8") as corpus_file:
+        return [line.strip() for line in corpus_file if line.strip()]
+
+
+def split_corpus(texts: List[str], holdout: float = 0.3, seed: int = 0) -> Tuple[List[str], List[str]]:
+    if not 0 < holdout < 1:
+        raise ValueError(f"Holdout fraction must be in (0, 1), got {holdout}")
+    order = np.random.default_rng(seed).permutation(len(texts))
+    held_out = max(1, int(round(len(texts) * holdout)))
+    return [texts[i] for i in sorted(order[held_out:])], [texts[i] for i in sorted(order[:held_out])]
+
+
+def train_linear_model(model_name: str, texts: List[str], output_path: str, backend: str = "torch") -> Dict[str, float]:
+    teacher = EnhancedSentimentAnalyzer(model_name, backend=backend)
+    batch = teacher.analyze_columnar(texts)
+    teacher.close()
+
+    scored = batch.label_ids != ERROR_LABEL_ID
+    texts = [text for text, keep in zip(texts, scored) if keep]
+    label_ids = batch.label_ids[scored]
+    if not texts:
+        raise ValueError("The transformer returned no usable labels to train the first-stage model on")
+
+    classifier = HashedLinearClassifier().fit(texts, label_ids)
+    classifier.save(output_path)
+    training_agreement = float(np.mean(classifier.predict_proba(texts).argmax(axis=1) == label_ids))
+    return {"texts": len(texts), "skipped_errors": int((~scored).sum()), "training_agreement": training_agreement}
+
+
+def run_cascade_check(model_name: str, thresholds: List[float], texts: List[str] = None, backend: str = "torch",
+                      cascade_model_path: Optional[str] = None) -> Dict[str, Dict]:
+    texts = texts or AGREEMENT_CORPUS
+    report = {}
+
+    baseline = EnhancedSentimentAnalyzer(model_name, backend=backend)
+    start = time.perf_counter()
+    baseline_labels = baseline.analyze_columnar(texts).label_ids
+    baseline_seconds = time.perf_counter() - start
+
+    for threshold in thresholds:
+        analyzer = EnhancedSentimentAnalyzer(model_name, backend=backend, cascade_threshold=threshold,
+                                             cascade_model_path=cascade_model_path)
+        start = time.perf_counter()
+        labels = analyzer.analyze_columnar(texts).label_ids
+        seconds = time.perf_counter() - start
+
+        cascade_stats = analyzer.get_cascade_stats()
+        report[str(threshold)] = {
+            "texts": len(texts),
+            "routing_ratio": cascade_stats["routing_ratio"],
+            "decided_by_first_stage": cascade_stats["decided_by_first_stage"],
+            "label_agreement": float(np.mean(labels == baseline_labels)),
+            "seconds": seconds,
+            "speedup_vs_transformer": baseline_seconds / seconds if seconds > 0 else 0.0
+        }
+        analyzer.close()
+
+    baseline.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the lexicon-first cascade against transformer-only scoring")
+    parser.add_argument("--model", default="cardiffnlp/twitter-roberta-base-sentiment")
+    parser.add_argument("--thresholds", nargs="+", type=float, default=[0.6, 0.7, 0.8])
+    parser.add_argument("--backend", default="torch", choices=BackendFactory.get_available_backends())
+    parser.add_argument("--corpus", help="Text file with one headline per line (defaults to the built-in corpus)")
+    parser.add_argument("--cascade-model", help="Hashed linear first-stage model (.npz) to blend with the lexicon")
+    parser.add_argument("--train-cascade-model", metavar="PATH",
+                        help="Distill a hashed linear first-stage model from the transformer labels and save it to PATH")
+    parser.add_argument("--train-corpus",
+                        help="Headlines to train the first-stage model on (default: a split of --corpus)")
+    parser.add_argument("--holdout", type=float, default=0.3,
+                        help="Fraction of --corpus held out for evaluation when no --train-corpus is given")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.corpus)
+    cascade_model_path = args.cascade_model
+    if args.train_cascade_model:
+        if args.train_corpus:
+            train_texts = load_corpus(args.train_corpus)
+        else:
+            train_texts, texts = split_corpus(texts, args.holdout)
+        training = train_linear_model(args.model, train_texts, args.train_cascade_model, args.backend)
+        cascade_model_path = args.train_cascade_model
+        if not args.json:
+            print(f"Trained first-stage model on {training['texts']} headlines "
+                  f"({training['training_agreement']*100:.1f}% agreement with the transformer on its training set, "
+                  f"{training['skipped_errors']} error rows skipped); evaluating on {len(texts)} held-out headlines")
+
+    report = run_cascade_check(args.model, args.thresholds, texts, args.backend, cascade_model_path)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    console = Console()
+    table = Table(title="🪜 Cascade vs Transformer-only", show_header=True, header_style="bold magenta")
+    table.add_column("Threshold", style="bold cyan")
+    table.add_column("Routed to Transformer", style="yellow")
+    table.add_column("Label Agreement", style="green")
+    table.add_column("Seconds", style="white")
+    table.add_column("Speedup", style="bold")
+
+    for threshold, stats in report.items():
+        table.add_row(
+            threshold,
+            f"{stats['routing_ratio']*100:.1f}%",
+            f"{stats['label_agreement']*100:.1f}%",
+            f"{stats['seconds']:.3f}",
+            f"{stats['speedup_vs_transformer']:.2f}x"
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,27 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+import argparse
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 from scraper import Newscraper
 from sentiment import SentimentAnalyzer
+from sentiment_cache import SentimentCache
+from http_cache import HttpCache
+from html_parsing import PARSER_BACKENDS
+from stream_display import stream_sentiment
+from inference_backends import BackendFactory
 
 
 class FinancialCLI:
-    def __init__(self):
+    def __init__(self, backend: str = "torch", parser_backend: Optional[str] = None):
         self.console = Console()
+        self.backend = backend
+        self.parser_backend = parser_backend
         self.scraper = None
         self.sentiment_analyzer = None
+        self.sentiment_cache = None
+        self.http_cache = None
 
     def display_banner(self):
         banner_text = """
@@ -30,15 +40,25 @@ class FinancialCLI:
             console=self.console,
         ) as progress:
             task1 = progress.add_task("Initializing web scraper...", total=None)
-            self.scraper = Newscraper()
+            self.http_cache = HttpCache()
+            self.scraper = Newscraper(http_cache=self.http_cache, parser_backend=self.parser_backend)
             progress.update(task1, completed=True)
             
-            task2 = progress.add_task("Loading sentiment analysis model...", total=None)
-            self.sentiment_analyzer = SentimentAnalyzer()
+            task2 = progress.add_task("Loading sentiment analysis model in the background...", total=None)
+            self.sentiment_cache = SentimentCache()
+            self.sentiment_analyzer = SentimentAnalyzer(cache=self.sentiment_cache, background_load=True, backend=self.backend)
             progress.update(task2, completed=True)
 
         self.console.print("✅ [green]All components initialized successfully![/green]\n")
 
+    def print_http_cache_stats(self):
+        if not self.http_cache:
+            return
+        for source, stats in self.http_cache.get_stats().items():
+            self.console.print(f"[dim]HTTP cache ({source}): {stats['not_modified']} of {stats['requests']} requests not modified "
+                               f"({stats['not_modified_rate']*100:.1f}%), {stats['fresh_hits']} served fresh, "
+                               f"{stats['bytes_saved']/1024:.0f} KB saved, {stats['extractions_reused']} extractions reused[/dim]")
+
 
     def create_news_table(self, news_data: Dict, title: str) -> Table:
         table = Table(title=title, show_header=True, header_style="bold magenta")
@@ -120,7 +140,9 @@ class FinancialCLI:
             progress.update(task, completed=True)
 
         self.console.print(f"\n✅ [green]Successfully scraped news from {news_data['source']}[/green]")
-        self.console.print(f"📅 [cyan]Timestamp: {news_data['timestamp']}[/cyan]\n")
+        self.console.print(f"📅 [cyan]Timestamp: {news_data['timestamp']}[/cyan]")
+        self.print_http_cache_stats()
+        self.console.print()
 
         if news_data['data']['headlines']:
             headlines_table = self.create_news_table(news_data['data']['headlines'], "📰 Market Headlines")
@@ -150,11 +172,22 @@ class FinancialCLI:
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
         ) as progress:
-            task = progress.add_task("Processing sentiment analysis...", total=None)
-            summary = self.sentiment_analyzer.get_sentiment_summary(all_texts)
-            progress.update(task, completed=True)
+            if not self.sentiment_analyzer.is_ready():
+                wait_task = progress.add_task("Waiting for sentiment model to finish loading...", total=None)
+                try:
+                    self.sentiment_analyzer.wait_until_ready()
+                except Exception as e:
+                    self.console.print(f"[red]❌ Failed to load sentiment model: {e}[/red]")
+                    return None
+                progress.update(wait_task, completed=True)
+
+        summary = stream_sentiment(self.console, self.sentiment_analyzer, all_texts, "Processing sentiment analysis...",
+                                   self.create_sentiment_table)
 
         self.display_sentiment_summary(summary)
+        if self.sentiment_cache:
+            cache_stats = self.sentiment_cache.get_stats()
+            self.console.print(f"[dim]Sentiment cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hit_rate']*100:.1f}% hit rate)[/dim]")
         return summary
 
     def full_analysis(self):
@@ -195,5 +228,12 @@ class FinancialCLI:
 
 
 if __name__ == "__main__":
-    cli = FinancialCLI()
+    parser = argparse.ArgumentParser(description="Financial News Analyzer")
+    parser.add_argument("--backend", default="torch", choices=BackendFactory.get_available_backends(),
+                        help="Inference backend for the sentiment model")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS,
+                        help="HTML parser backend (default: the fastest installed one)")
+    args = parser.parse_args()
+
+    cli = FinancialCLI(backend=args.backend, parser_backend=args.parser)
     cli.run()
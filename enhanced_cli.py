@@ -4,17 +4,33 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt, Confirm
 from rich.columns import Columns
+import argparse
 import time
 from typing import Dict, List, Optional
 from multi_scraper import MultiSourceScraper, ScraperFactory
 from sentiment import SentimentAnalyzer
+from sentiment_cache import SentimentCache
+from http_cache import HttpCache
+from seen_index import SeenHeadlineIndex
+from html_parsing import PARSER_BACKENDS
+from stream_display import stream_sentiment
+from inference_backends import BackendFactory
 
 
 class EnhancedFinancialCLI:
-    def __init__(self):
+    def __init__(self, backend: str = "torch", dedup_threshold: Optional[float] = None, snapshot_max_age: float = 60.0,
+                 parser_backend: Optional[str] = None, new_only: bool = False):
         self.console = Console()
+        self.backend = backend
+        self.parser_backend = parser_backend
+        self.new_only = new_only
+        self.dedup_threshold = dedup_threshold
+        self.snapshot_max_age = snapshot_max_age
         self.multi_scraper = None
         self.sentiment_analyzer = None
+        self.sentiment_cache = None
+        self.http_cache = None
+        self.seen_index = None
         self.available_sources = ScraperFactory.get_available_sources()
 
     def display_banner(self):
@@ -68,15 +84,29 @@ class EnhancedFinancialCLI:
             console=self.console,
         ) as progress:
             task1 = progress.add_task("Initializing multi-source scraper...", total=None)
-            self.multi_scraper = MultiSourceScraper(selected_sources)
+            self.http_cache = HttpCache()
+            self.seen_index = SeenHeadlineIndex()
+            self.multi_scraper = MultiSourceScraper(selected_sources, max_age=self.snapshot_max_age,
+                                                    http_cache=self.http_cache, parser_backend=self.parser_backend,
+                                                    seen_index=self.seen_index)
             progress.update(task1, completed=True)
             
-            task2 = progress.add_task("Loading sentiment analysis model...", total=None)
-            self.sentiment_analyzer = SentimentAnalyzer()
+            task2 = progress.add_task("Loading sentiment analysis model in the background...", total=None)
+            self.sentiment_cache = SentimentCache()
+            self.sentiment_analyzer = SentimentAnalyzer(cache=self.sentiment_cache, background_load=True, backend=self.backend,
+                                                        dedup_threshold=self.dedup_threshold)
             progress.update(task2, completed=True)
 
         self.console.print("✅ [green]All components initialized successfully![/green]\n")
 
+    def print_http_cache_stats(self):
+        if not self.http_cache:
+            return
+        for source, stats in self.http_cache.get_stats().items():
+            self.console.print(f"[dim]HTTP cache ({source}): {stats['not_modified']} of {stats['requests']} requests not modified "
+                               f"({stats['not_modified_rate']*100:.1f}%), {stats['fresh_hits']} served fresh, "
+                               f"{stats['bytes_saved']/1024:.0f} KB saved, {stats['extractions_reused']} extractions reused[/dim]")
+
     def create_source_summary_table(self, all_results: Dict) -> Table:
         table = Table(title="📊 Source Summary", show_header=True, header_style="bold magenta")
         table.add_column("Source", style="bold cyan", width=15)
@@ -193,29 +223,16 @@ class EnhancedFinancialCLI:
             console=self.console,
         ) as progress:
             task = progress.add_task("Fetching news from multiple sources...", total=None)
-            all_results = self.multi_scraper.scrape_all_sources()
+            snapshot = self.multi_scraper.snapshot()
             progress.update(task, completed=True)
 
-        self.console.print(f"\n✅ [green]Successfully scraped from {len(all_results)} sources[/green]")
+        self.console.print(f"\n✅ [green]Successfully scraped from {len(snapshot.results)} sources[/green]")
         
-        summary_table = self.create_source_summary_table(all_results)
+        summary_table = self.create_source_summary_table(snapshot.results)
         self.console.print(summary_table)
+        self.print_http_cache_stats()
 
-        return all_results
-
-    def get_combined_analysis(self):
-        self.console.print("\n[bold yellow]Getting combined news analysis...[/bold yellow]")
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task("Combining news from all sources...", total=None)
-            combined_data = self.multi_scraper.get_combined_news()
-            progress.update(task, completed=True)
-
-        return combined_data
+        return snapshot
 
     def analyze_sentiment(self, combined_data: Dict):
         all_texts = combined_data.get("headlines", []) + combined_data.get("stock_news", [])
@@ -231,22 +248,41 @@ class EnhancedFinancialCLI:
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
         ) as progress:
-            task = progress.add_task("Processing multi-source sentiment analysis...", total=None)
-            summary = self.sentiment_analyzer.get_sentiment_summary(all_texts)
-            progress.update(task, completed=True)
+            if not self.sentiment_analyzer.is_ready():
+                wait_task = progress.add_task("Waiting for sentiment model to finish loading...", total=None)
+                try:
+                    self.sentiment_analyzer.wait_until_ready()
+                except Exception as e:
+                    self.console.print(f"[red]❌ Failed to load sentiment model: {e}[/red]")
+                    return None
+                progress.update(wait_task, completed=True)
+
+        summary = stream_sentiment(self.console, self.sentiment_analyzer, all_texts, "Processing multi-source sentiment analysis...",
+                                   self.create_sentiment_table)
 
         self.display_sentiment_summary(summary, combined_data)
+        if self.sentiment_cache:
+            cache_stats = self.sentiment_cache.get_stats()
+            self.console.print(f"[dim]Sentiment cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hit_rate']*100:.1f}% hit rate)[/dim]")
+        dedup_stats = self.sentiment_analyzer.get_dedup_stats()
+        if dedup_stats:
+            self.console.print(f"[dim]Near-duplicate headlines: {dedup_stats['inferences_saved']} of {dedup_stats['texts']} reused a cluster result ({dedup_stats['saved_ratio']*100:.1f}% fewer inferences)[/dim]")
         return summary
 
     def full_analysis(self):
         self.console.print("\n[bold magenta]🚀 Starting comprehensive multi-source analysis...[/bold magenta]")
         
-        all_results = self.scrape_all_sources()
+        snapshot = self.scrape_all_sources()
+        all_results = snapshot.results
         if not all_results:
             return None, None, None
         
-        time.sleep(1)
-        combined_data = self.get_combined_analysis()
+        combined_data = snapshot.get_combined_news()
+        new_data = snapshot.get_new_news()
+        self.console.print(f"[dim]{len(new_data['headlines'])} headlines and {len(new_data['stock_news'])} market updates "
+                           f"are new since the last run[/dim]")
+        if self.new_only:
+            combined_data = new_data
         
         if combined_data.get("headlines") or combined_data.get("stock_news"):
             self.console.print(f"\n[bold green]📰 Found {len(combined_data.get('headlines', []))} headlines and {len(combined_data.get('stock_news', []))} market updates[/bold green]")
@@ -282,7 +318,9 @@ class EnhancedFinancialCLI:
             choice = Prompt.ask("Choose option", choices=["1", "2", "3", "4"], default="1")
             
             if choice == "1":
-                self.full_analysis()
+                _, _, sentiment_summary = self.full_analysis()
+                if sentiment_summary is not None:
+                    self.multi_scraper.commit_seen()
             elif choice == "2":
                 source = Prompt.ask("Enter source name", choices=self.available_sources)
                 try:
@@ -293,7 +331,10 @@ class EnhancedFinancialCLI:
                     self.console.print(f"[red]Error: {e}[/red]")
             elif choice == "3":
                 selected_sources = self.select_sources()
-                self.multi_scraper = MultiSourceScraper(selected_sources)
+                self.multi_scraper = MultiSourceScraper(selected_sources, max_age=self.snapshot_max_age,
+                                                        http_cache=self.http_cache,
+                                                        parser_backend=self.parser_backend,
+                                                        seen_index=self.seen_index)
                 self.console.print(f"✅ Updated sources: {', '.join(selected_sources)}")
             else:
                 break
@@ -321,13 +362,32 @@ class EnhancedFinancialCLI:
             self.console.print(sentiment_table)
             
             self.console.print("\n[bold green]✅ Multi-source analysis completed successfully![/bold green]")
+            self.multi_scraper.commit_seen()
             
             if Confirm.ask("\nEnter interactive mode?", default=False):
                 self.interactive_mode()
+        elif all_results and self.new_only:
+            self.console.print("[yellow]Nothing new since the last run.[/yellow]")
         else:
             self.console.print("[red]❌ Analysis failed. Please check your internet connection.[/red]")
 
 
 if __name__ == "__main__":
-    cli = EnhancedFinancialCLI()
+    parser = argparse.ArgumentParser(description="Multi-Source Financial Analyzer")
+    parser.add_argument("--backend", default="torch", choices=BackendFactory.get_available_backends(),
+                        help="Inference backend for the sentiment model")
+    parser.add_argument("--dedup-threshold", type=float, default=None,
+                        help="Share one sentiment inference between headlines at least this similar, e.g. 0.95 "
+                             "(off by default; headlines with different keyword polarity are never merged)")
+    parser.add_argument("--snapshot-max-age", type=float, default=60.0,
+                        help="Seconds a scrape is reused by repeated analyses before the sources are fetched again")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS,
+                        help="HTML parser backend (default: the fastest installed one)")
+    parser.add_argument("--new-only", action="store_true",
+                        help="Only analyze headlines not seen in a previous run")
+    args = parser.parse_args()
+
+    cli = EnhancedFinancialCLI(backend=args.backend, dedup_threshold=args.dedup_threshold,
+                               snapshot_max_age=args.snapshot_max_age, parser_backend=args.parser,
+                               new_only=args.new_only)
     cli.run()
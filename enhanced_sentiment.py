@@ -1,45 +1,123 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from scipy.special import softmax
-import torch
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+import itertools
+import math
+from concurrent.futures import ThreadPoolExecutor
 import re
+import time
 import numpy as np
+from batching import STREAM_CHUNK_BATCHES, BackgroundPrefetcher, LengthBucketScheduler, pad_token_ids
+from financial_lexicon import FinancialLexicon, load_keywords
+from sentiment_cache import SentimentCache
+from sentiment_batch import RunningSentimentSummary, SentimentBatch
+from headline_dedup import create_deduplicator
+from market_data import market_data_scores, parse_market_batch
+from cascade import HashedLinearClassifier, LexiconCascade
+from model_registry import ModelRegistry, resolve_precision
 
 
 class EnhancedSentimentAnalyzer:
-    def __init__(self, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment"):
+    def __init__(self, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment", batch_size: int = 32, max_length: int = 512,
+                 cache: Optional[SentimentCache] = None, background_load: bool = False, device: str = "cpu",
+                 precision: str = "fp32", backend: str = "torch", num_threads: Optional[int] = None,
+                 lexicon_path: Optional[str] = None, pipeline_depth: int = 2, pipeline_chunk_batches: int = 4,
+                 dedup_threshold: Optional[float] = None, cascade_threshold: Optional[float] = None,
+                 cascade_model_path: Optional[str] = None):
+        self._configure(model_name, batch_size, max_length, cache, device, precision, backend, num_threads,
+                        lexicon_path, pipeline_depth, pipeline_chunk_batches, dedup_threshold, cascade_threshold,
+                        cascade_model_path)
+        if background_load:
+            self._start_background_load()
+        else:
+            self._load_model()
+
+    def _configure(self, model_name: str, batch_size: int = 32, max_length: int = 512,
+                   cache: Optional[SentimentCache] = None, device: str = "cpu", precision: str = "fp32",
+                   backend: str = "torch", num_threads: Optional[int] = None, lexicon_path: Optional[str] = None,
+                   pipeline_depth: int = 2, pipeline_chunk_batches: int = 4, dedup_threshold: Optional[float] = None,
+                   cascade_threshold: Optional[float] = None, cascade_model_path: Optional[str] = None):
         self.model_name = model_name
-        self.model = None
+        self.device = device
+        self.precision = resolve_precision(precision, device)
+        self.backend_name = backend
+        self.num_threads = num_threads
+        self.cache_model_id = f"{model_name}:{backend}:{self.precision}"
+        self.backend = None
         self.tokenizer = None
         self.labels = ['Negative', 'Neutral', 'Positive']
-        self.financial_keywords = self._load_financial_keywords()
-        self._load_model()
+        self.financial_weight = 0.3
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.scheduler = LengthBucketScheduler(batch_size, max_length)
+        self.cache = cache
+        self.model_revision = None
+        self.stream_summary = RunningSentimentSummary()
+        self.pipeline_depth = pipeline_depth
+        self.pipeline_chunk_batches = pipeline_chunk_batches
+        self.pipeline_stats = {"chunks": 0, "prepare_seconds": 0.0, "inference_seconds": 0.0, "stall_seconds": 0.0}
+        self._load_future = None
+        self.financial_keywords = self._load_financial_keywords(lexicon_path)
+        self.lexicon = FinancialLexicon(self.financial_keywords, ["negative", "neutral", "positive"])
+        self.deduplicator = create_deduplicator(dedup_threshold, self.lexicon)
+        self.cascade = self._create_cascade(cascade_threshold, cascade_model_path)
 
     def _load_model(self):
         try:
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self.backend = ModelRegistry.acquire(
+                self.model_name, self.device, self.precision, self.backend_name, self.num_threads
+            )
         except Exception as e:
             print(f"Error loading model: {e}")
             raise
 
-    def _load_financial_keywords(self) -> Dict[str, List[str]]:
-        return {
-            "positive": [
-                "surge", "rally", "gains", "bullish", "upward", "growth", "profit", "earnings",
-                "outperform", "beat", "strong", "robust", "recovery", "boom", "soar", "climb",
-                "rise", "increase", "advance", "momentum", "optimistic", "confident", "upgrade"
-            ],
-            "negative": [
-                "plunge", "crash", "decline", "bearish", "downward", "loss", "deficit", "miss",
-                "underperform", "weak", "fragile", "recession", "slump", "fall", "drop",
-                "decrease", "retreat", "pessimistic", "concern", "worry", "downgrade", "risk"
-            ],
-            "neutral": [
-                "stable", "steady", "maintain", "hold", "unchanged", "flat", "sideways",
-                "consolidate", "range", "mixed", "moderate", "cautious", "watch", "monitor"
-            ]
-        }
+        self.tokenizer = self.backend.tokenizer
+        self.model_revision = self.backend.revision
+        if self.cache:
+            self.cache.register_model(self.cache_model_id, self.model_revision)
+        self._warm_up()
+
+    def _warm_up(self):
+        input_ids = self.tokenizer(["Markets open steady"], truncation=True, max_length=self.max_length)["input_ids"]
+        self._score_batch(input_ids, len(input_ids[0]))
+
+    def _start_background_load(self):
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment-model-load")
+        self._load_future = executor.submit(self._load_model)
+        executor.shutdown(wait=False)
+
+    def close(self):
+        if self._load_future is not None and not self._load_future.done():
+            self._load_future.add_done_callback(lambda _: self._release_model())
+            return
+        self._release_model()
+
+    def _release_model(self):
+        if self.backend is not None:
+            ModelRegistry.release(self.model_name, self.device, self.precision, self.backend_name, self.num_threads)
+            self.backend = None
+            self.tokenizer = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def is_ready(self) -> bool:
+        return self._load_future is None or self._load_future.done()
+
+    def wait_until_ready(self):
+        if self._load_future is not None:
+            self._load_future.result()
+
+    def _create_cascade(self, threshold: Optional[float], model_path: Optional[str] = None) -> Optional[LexiconCascade]:
+        if not threshold:
+            return None
+        linear_model = HashedLinearClassifier.load(model_path) if model_path else None
+        return LexiconCascade(self.lexicon, threshold, linear_model=linear_model)
+
+    def _load_financial_keywords(self, lexicon_path: Optional[str] = None) -> Dict[str, List[str]]:
+        return load_keywords(lexicon_path)
 
     def preprocess_text(self, text: str, source: str = None) -> str:
         text = text.strip()
@@ -60,136 +138,283 @@ class EnhancedSentimentAnalyzer:
         return processed_text
 
     def calculate_financial_bias(self, text: str) -> Dict[str, float]:
-        text_lower = text.lower()
-        bias_scores = {"positive": 0, "negative": 0, "neutral": 0}
-        
-        for sentiment, keywords in self.financial_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    bias_scores[sentiment] += 1
-        
-        total_keywords = sum(bias_scores.values())
-        if total_keywords > 0:
-            for sentiment in bias_scores:
-                bias_scores[sentiment] = bias_scores[sentiment] / total_keywords
-        else:
-            bias_scores = {"positive": 0.33, "negative": 0.33, "neutral": 0.34}
-        
-        return bias_scores
+        return self._bias_dict(self.lexicon.bias_matrix([text])[0])
+
+    def calculate_financial_bias_batch(self, texts: List[str]) -> np.ndarray:
+        return self.lexicon.bias_matrix(texts)
+
+    def _bias_dict(self, bias_row: np.ndarray) -> Dict[str, float]:
+        return {
+            "positive": float(bias_row[2]),
+            "negative": float(bias_row[0]),
+            "neutral": float(bias_row[1])
+        }
 
     def analyze_sentiment(self, text: str, source: str = None) -> Dict[str, any]:
-        if not text.strip():
-            return {
-                "text": text,
-                "sentiment": "Neutral",
-                "confidence": 0.0,
-                "scores": {"Negative": 0.33, "Neutral": 0.34, "Positive": 0.33},
-                "financial_bias": {"positive": 0.33, "negative": 0.33, "neutral": 0.34},
-                "source": source
-            }
-
-        processed_text = self.preprocess_text(text, source)
-        financial_bias = self.calculate_financial_bias(text)
-        
+        return self.analyze_batch([text], [source])[0]
+
+    def _score_batch(self, input_ids: List[List[int]], padded_length: int) -> np.ndarray:
+        ids, attention_mask = pad_token_ids(input_ids, padded_length, self.tokenizer.pad_token_id)
+        logits = self.backend.predict(ids, attention_mask)
+        return softmax(logits, axis=1).astype(np.float64)
+
+    def _tokenize(self, texts: List[str]) -> List[Optional[List[int]]]:
         try:
-            encoded_text = self.tokenizer(processed_text, return_tensors='pt', truncation=True, max_length=512)
-            
-            with torch.no_grad():
-                output = self.model(**encoded_text)
-            
-            scores = output.logits[0].detach().numpy()
-            scores = softmax(scores)
-            
-            financial_weight = 0.3
-            adjusted_scores = np.array([
-                scores[0] * (1 - financial_weight) + financial_bias["negative"] * financial_weight,
-                scores[1] * (1 - financial_weight) + financial_bias["neutral"] * financial_weight,
-                scores[2] * (1 - financial_weight) + financial_bias["positive"] * financial_weight
-            ])
-            
-            max_score_index = adjusted_scores.argmax()
-            sentiment_label = self.labels[max_score_index]
-            confidence = float(adjusted_scores[max_score_index])
-            
-            score_dict = {label: float(score) for label, score in zip(self.labels, adjusted_scores)}
-            
-            return {
-                "text": text,
-                "sentiment": sentiment_label,
-                "confidence": confidence,
-                "scores": score_dict,
-                "financial_bias": financial_bias,
-                "source": source,
-                "raw_scores": {label: float(score) for label, score in zip(self.labels, scores)}
-            }
+            return self.tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
+        except Exception as e:
+            if len(texts) == 1:
+                print(f"Error analyzing sentiment: {e}")
+                return [None]
+        return [self._tokenize([text])[0] for text in texts]
+
+    def _score_rows(self, input_ids: List[List[int]], padded_length: int) -> Tuple[np.ndarray, List[int]]:
+        try:
+            return self._score_batch(input_ids, padded_length), list(range(len(input_ids)))
         except Exception as e:
-            print(f"Error analyzing sentiment: {e}")
-            return {
-                "text": text,
-                "sentiment": "Error",
-                "confidence": 0.0,
-                "scores": {"Negative": 0.0, "Neutral": 0.0, "Positive": 0.0},
-                "financial_bias": financial_bias,
-                "source": source
-            }
-
-    def analyze_batch(self, texts: List[str], sources: List[str] = None) -> List[Dict[str, any]]:
+            if len(input_ids) == 1:
+                print(f"Error analyzing sentiment: {e}")
+                return np.empty((0, len(self.labels))), []
+
+        rows = []
+        scored = []
+        for position, ids in enumerate(input_ids):
+            row_scores, row_scored = self._score_rows([ids], min(len(ids), padded_length))
+            if row_scored:
+                rows.append(row_scores[0])
+                scored.append(position)
+        return (np.stack(rows) if rows else np.empty((0, len(self.labels)))), scored
+
+    def _fill_scores(self, batch: SentimentBatch, batch_indices: List[int], scores: np.ndarray):
+        adjusted_scores = scores * (1 - self.financial_weight) + batch.financial_bias[batch_indices] * self.financial_weight
+        max_score_indices = adjusted_scores.argmax(axis=1)
+
+        batch.scores[batch_indices] = adjusted_scores
+        batch.raw_scores[batch_indices] = scores
+        batch.has_raw_scores[batch_indices] = True
+        batch.label_ids[batch_indices] = max_score_indices
+        batch.confidence[batch_indices] = adjusted_scores[np.arange(len(batch_indices)), max_score_indices]
+
+    def _fill_first_stage(self, batch: SentimentBatch, texts: List[str], batch_indices: List[int], probabilities: np.ndarray):
+        max_score_indices = probabilities.argmax(axis=1)
+        batch.financial_bias[batch_indices] = self.calculate_financial_bias_batch([texts[i] for i in batch_indices])
+        batch.scores[batch_indices] = probabilities
+        batch.label_ids[batch_indices] = max_score_indices
+        batch.confidence[batch_indices] = probabilities[np.arange(len(batch_indices)), max_score_indices]
+
+    def _cluster(self, texts: List[str]) -> Tuple[List[int], np.ndarray]:
+        if self.deduplicator is None or len(texts) < 2:
+            return list(range(len(texts))), np.arange(len(texts))
+        return self.deduplicator.cluster(texts)
+
+    def analyze_columnar(self, texts: List[str], sources: List[str] = None, batch_size: Optional[int] = None) -> SentimentBatch:
         if sources is None:
             sources = [None] * len(texts)
-        
-        results = []
-        for text, source in zip(texts, sources):
-            result = self.analyze_sentiment(text, source)
-            results.append(result)
-        return results
+        representatives, labels = self._cluster(texts)
+        if len(representatives) == len(texts):
+            return self._analyze_columnar(texts, sources, batch_size)
+
+        batch = self._analyze_columnar(
+            [texts[i] for i in representatives], [sources[i] for i in representatives], batch_size
+        ).take(labels)
+        batch.texts = list(texts)
+        batch.sources = list(sources)
+        return batch
+
+    def _analyze_columnar(self, texts: List[str], sources: List[str], batch_size: Optional[int] = None) -> SentimentBatch:
+        batch = SentimentBatch.empty(texts, sources, enhanced=True)
+        for _ in self._fill_columnar(batch, batch_size):
+            pass
+        return batch
+
+    def _fill_columnar(self, batch: SentimentBatch, batch_size: Optional[int] = None) -> Iterator[List[int]]:
+        texts, sources = batch.texts, batch.sources
+        pending = []
+        blank = []
+
+        for i, text in enumerate(texts):
+            if text.strip():
+                pending.append(i)
+            else:
+                batch.scores[i] = [0.33, 0.34, 0.33]
+                batch.financial_bias[i] = [0.33, 0.34, 0.33]
+                batch.label_ids[i] = 1
+                blank.append(i)
+        if blank:
+            yield blank
+
+        if pending:
+            records = parse_market_batch([texts[i] for i in pending])
+            market_indices = [i for i, record in zip(pending, records) if record is not None]
+            if market_indices:
+                self._fill_first_stage(batch, texts, market_indices,
+                                       market_data_scores([record for record in records if record is not None]))
+                pending = [i for i, record in zip(pending, records) if record is None]
+                yield market_indices
+
+        if pending and self.cascade is not None:
+            decided, probabilities = self.cascade.route([texts[i] for i in pending])
+            decided_indices = [i for i, is_decided in zip(pending, decided) if is_decided]
+            if decided_indices:
+                self._fill_first_stage(batch, texts, decided_indices, probabilities[decided])
+                yield decided_indices
+            pending = [i for i, is_decided in zip(pending, decided) if not is_decided]
+
+        if not pending:
+            return
+
+        self.wait_until_ready()
+        chunk_size = (batch_size or self.batch_size) * self.pipeline_chunk_batches if self.pipeline_depth > 0 else len(pending)
+        chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+        prepared = map(lambda chunk: self._prepare_chunk(batch, texts, sources, chunk, batch_size), chunks)
+
+        prefetcher = None
+        if self.pipeline_depth > 0 and len(chunks) > 1:
+            prefetcher = BackgroundPrefetcher(prepared, self.pipeline_depth, name="sentiment-tokenize")
+            prepared = prefetcher
+
+        try:
+            for work in prepared:
+                if work["hits"]:
+                    hit_indices, hit_scores = work["hits"]
+                    self._fill_scores(batch, hit_indices, hit_scores)
+                    yield hit_indices
+
+                for batch_indices, batch_keys, input_ids, padded_length in work["batches"]:
+                    start = time.perf_counter()
+                    scores, scored = self._score_rows(input_ids, padded_length)
+                    self.pipeline_stats["inference_seconds"] += time.perf_counter() - start
+
+                    if scored:
+                        self._fill_scores(batch, [batch_indices[k] for k in scored], scores)
+                        if self.cache:
+                            self.cache.put_many({batch_keys[k]: row for k, row in zip(scored, scores)})
+                    yield batch_indices
+
+                if work["failed"]:
+                    yield work["failed"]
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+                self.pipeline_stats["stall_seconds"] += prefetcher.stall_seconds
+
+    def _prepare_chunk(self, batch: SentimentBatch, texts: List[str], sources: List[str], chunk: List[int],
+                       batch_size: Optional[int] = None) -> Dict[str, any]:
+        start = time.perf_counter()
+        work = {"hits": None, "batches": [], "failed": []}
+
+        batch.financial_bias[chunk] = self.calculate_financial_bias_batch([texts[i] for i in chunk])
+        processed_texts = [self.preprocess_text(texts[i], sources[i]) for i in chunk]
+
+        cache_keys = []
+        if self.cache:
+            cache_keys = [SentimentCache.make_key(self.cache_model_id, self.model_revision, t) for t in processed_texts]
+            cached_scores = self.cache.get_many(cache_keys)
+            hits = [p for p, key in enumerate(cache_keys) if key in cached_scores]
+            if hits:
+                work["hits"] = ([chunk[p] for p in hits], np.stack([cached_scores[cache_keys[p]] for p in hits]))
+            misses = [p for p, key in enumerate(cache_keys) if key not in cached_scores]
+        else:
+            misses = list(range(len(chunk)))
+
+        if misses:
+            encoded_texts = self._tokenize([processed_texts[p] for p in misses])
+            work["failed"] = [chunk[misses[m]] for m, ids in enumerate(encoded_texts) if ids is None]
+            misses = [p for p, ids in zip(misses, encoded_texts) if ids is not None]
+            encoded_texts = [ids for ids in encoded_texts if ids is not None]
+
+            lengths = [len(ids) for ids in encoded_texts]
+            for positions, padded_length in self.scheduler.schedule(lengths, batch_size):
+                batch_positions = [misses[m] for m in positions]
+                work["batches"].append((
+                    [chunk[p] for p in batch_positions],
+                    [cache_keys[p] for p in batch_positions] if self.cache else [],
+                    [encoded_texts[m] for m in positions],
+                    padded_length
+                ))
+
+        self.pipeline_stats["chunks"] += 1
+        self.pipeline_stats["prepare_seconds"] += time.perf_counter() - start
+        return work
+
+    def analyze_batch(self, texts: List[str], sources: List[str] = None, batch_size: Optional[int] = None) -> List[Dict[str, any]]:
+        return self.analyze_columnar(texts, sources, batch_size).to_dicts()
+
+    def _stream_columnar(self, texts: List[str], sources: List[str], batch_size: Optional[int] = None) -> Iterator[SentimentBatch]:
+        representatives, labels = self._cluster(texts)
+        members = [[] for _ in representatives]
+        for index, label in enumerate(labels):
+            members[label].append(index)
+
+        batch = SentimentBatch.empty([texts[i] for i in representatives], [sources[i] for i in representatives],
+                                     enhanced=True)
+        for filled in self._fill_columnar(batch, batch_size):
+            rows = sorted(index for label in filled for index in members[label])
+            done = batch.take(labels[rows])
+            done.texts = [texts[i] for i in rows]
+            done.sources = [sources[i] for i in rows]
+            yield done
+
+    def analyze_stream(self, texts: Iterable[str], sources: Iterable[str] = None, chunk_size: Optional[int] = None,
+                       summary: Optional[RunningSentimentSummary] = None) -> Iterator[SentimentBatch]:
+        self.stream_summary = summary if summary is not None else RunningSentimentSummary()
+        window = self.batch_size * max(1, self.pipeline_chunk_batches)
+        chunk_size = chunk_size or window * math.ceil(self.batch_size * STREAM_CHUNK_BATCHES / window)
+        items = zip(texts, sources if sources is not None else itertools.repeat(None))
+
+        while True:
+            chunk = list(itertools.islice(items, chunk_size))
+            if not chunk:
+                return
+            for batch in self._stream_columnar([text for text, _ in chunk], [source for _, source in chunk]):
+                self.stream_summary.update(batch)
+                yield batch
+
+    def get_stream_summary(self) -> Dict[str, any]:
+        summary = self.stream_summary.snapshot()
+        if "financial_bias_summary" not in summary:
+            summary["source_breakdown"] = {}
+            summary["financial_bias_summary"] = {"positive": 0, "negative": 0, "neutral": 0}
+        summary["market_outlook"] = self._determine_market_outlook(
+            summary["sentiment_distribution"], summary["financial_bias_summary"]
+        )
+        return summary
+
+    def get_padding_stats(self) -> Dict[str, float]:
+        return self.scheduler.get_padding_stats()
+
+    def get_dedup_stats(self) -> Dict[str, float]:
+        return self.deduplicator.get_stats() if self.deduplicator else {}
+
+    def get_cascade_stats(self) -> Dict[str, float]:
+        return self.cascade.get_stats() if self.cascade else {}
+
+    def get_pipeline_stats(self) -> Dict[str, float]:
+        stats = dict(self.pipeline_stats)
+        prepare_seconds = stats["prepare_seconds"]
+        stats["hidden_prepare_ratio"] = (
+            max(0.0, 1 - stats["stall_seconds"] / prepare_seconds) if prepare_seconds > 0 else 0.0
+        )
+        return stats
 
     def get_sentiment_summary(self, texts: List[str], sources: List[str] = None) -> Dict[str, any]:
-        results = self.analyze_batch(texts, sources)
-        
-        sentiment_counts = {"Positive": 0, "Neutral": 0, "Negative": 0}
-        source_sentiment = {}
-        total_confidence = 0
-        financial_bias_totals = {"positive": 0, "negative": 0, "neutral": 0}
-        
-        for result in results:
-            sentiment = result["sentiment"]
-            source = result.get("source", "unknown")
-            
-            if sentiment in sentiment_counts:
-                sentiment_counts[sentiment] += 1
-            
-            if source not in source_sentiment:
-                source_sentiment[source] = {"Positive": 0, "Neutral": 0, "Negative": 0, "total": 0}
-            
-            if sentiment in source_sentiment[source]:
-                source_sentiment[source][sentiment] += 1
-            source_sentiment[source]["total"] += 1
-            
-            total_confidence += result["confidence"]
-            
-            if "financial_bias" in result:
-                for bias_type, value in result["financial_bias"].items():
-                    financial_bias_totals[bias_type] += value
-        
-        total_texts = len(results)
-        avg_confidence = total_confidence / total_texts if total_texts > 0 else 0
-        
-        for bias_type in financial_bias_totals:
-            financial_bias_totals[bias_type] /= total_texts if total_texts > 0 else 1
-        
+        return self.summarize_batch(self.analyze_columnar(texts, sources))
+
+    def summarize_batch(self, batch: SentimentBatch) -> Dict[str, any]:
+        sentiment_counts = batch.sentiment_distribution()
+        financial_bias_totals = batch.financial_bias_summary()
         dominant_sentiment = max(sentiment_counts, key=sentiment_counts.get)
         
         market_outlook = self._determine_market_outlook(sentiment_counts, financial_bias_totals)
         
         return {
-            "total_analyzed": total_texts,
+            "total_analyzed": len(batch),
             "sentiment_distribution": sentiment_counts,
-            "source_breakdown": source_sentiment,
+            "source_breakdown": batch.source_breakdown(),
             "dominant_sentiment": dominant_sentiment,
-            "average_confidence": avg_confidence,
+            "average_confidence": batch.average_confidence(),
             "financial_bias_summary": financial_bias_totals,
             "market_outlook": market_outlook,
-            "detailed_results": results
+            "detailed_results": batch
         }
 
     def _determine_market_outlook(self, sentiment_counts: Dict, financial_bias: Dict) -> Dict[str, str]:
@@ -236,23 +461,30 @@ class EnhancedSentimentAnalyzer:
         }
 
     def get_source_comparison(self, multi_source_data: Dict) -> Dict[str, any]:
-        source_analyses = {}
+        all_texts = []
+        all_sources = []
         
         for source, data in multi_source_data.items():
             if "data" in data and isinstance(data["data"], dict):
                 headlines = data["data"].get("headlines", [])
                 stock_news = data["data"].get("stock_news", [])
-                all_texts = headlines + stock_news
-                
-                if all_texts:
-                    source_summary = self.get_sentiment_summary(all_texts, [source] * len(all_texts))
-                    source_analyses[source] = {
-                        "sentiment_summary": source_summary,
-                        "article_count": len(all_texts),
-                        "dominant_sentiment": source_summary["dominant_sentiment"],
-                        "confidence": source_summary["average_confidence"],
-                        "market_outlook": source_summary["market_outlook"]
-                    }
+                texts = headlines + stock_news
+                all_texts.extend(texts)
+                all_sources.extend([source] * len(texts))
+        
+        source_analyses = {}
+        if all_texts:
+            batch = self.analyze_columnar(all_texts, all_sources)
+            
+            for source, source_batch in batch.group_by_source().items():
+                source_summary = self.summarize_batch(source_batch)
+                source_analyses[source] = {
+                    "sentiment_summary": source_summary,
+                    "article_count": len(source_batch),
+                    "dominant_sentiment": source_summary["dominant_sentiment"],
+                    "confidence": source_summary["average_confidence"],
+                    "market_outlook": source_summary["market_outlook"]
+                }
         
         return {
             "source_analyses": source_analyses,
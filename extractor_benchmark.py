@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+from bs4 import BeautifulSoup
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from multi_scraper import ScraperFactory
+from html_parsing import PARSER_BACKENDS, available_parser_backends, parse_html
+
+
+FIXTURE_DIR = Path(__file__).parent / "benchmark_data" / "html"
+GOLDEN_PATH = FIXTURE_DIR / "golden.json"
+
+FIXTURES = {
+    "livemint_market": ("livemint", "base_url", [("extract_market_headlines", {}), ("extract_stock_market_news", {})]),
+    "google_finance": ("google", "base_url", [("extract_google_finance_news", {}), ("extract_market_data", {})]),
+    "google_news": ("google", "news_url", [("extract_google_finance_news", {"limit": 10})]),
+    "yahoo_finance": ("yahoo", "base_url", [("extract_yahoo_headlines", {}), ("extract_market_movers", {})]),
+    "yahoo_news": ("yahoo", "news_url", [("extract_yahoo_headlines", {"limit": 10})]),
+    "marketwatch_latest": ("marketwatch", "news_url", [("extract_marketwatch_news", {})])
+}
+
+
+def load_fixture(name: str) -> bytes:
+    return (FIXTURE_DIR / f"{name}.html").read_bytes()
+
+
+def record_fixtures(names: List[str]) -> List[str]:
+    recorded = []
+    for name in names:
+        source, url_attribute, _ = FIXTURES[name]
+        scraper = ScraperFactory.create_scraper(source)
+        url = getattr(scraper, url_attribute)
+        response = scraper.session.get(url, timeout=15)
+        if response.status_code != 200:
+            print(f"Failed to record {name} from {url}: {response.status_code}")
+            continue
+        (FIXTURE_DIR / f"{name}.html").write_bytes(response.content)
+        recorded.append(name)
+    return recorded
+
+
+def extract_all(name: str, soup: BeautifulSoup) -> Dict[str, List[str]]:
+    source, _, extractors = FIXTURES[name]
+    scraper = ScraperFactory.create_scraper(source)
+    return {method: getattr(scraper, method)(soup, **kwargs) for method, kwargs in extractors}
+
+
+def _median_ms(function, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _allocations_kb(function) -> Dict[str, float]:
+    tracemalloc.start()
+    try:
+        function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_kb": peak / 1024, "retained_kb": current / 1024}
+
+
+def parse_fixture(name: str, backend: str, full_tree: bool = False) -> BeautifulSoup:
+    source, _, _ = FIXTURES[name]
+    targets = None if full_tree else ScraperFactory.create_scraper(source).parse_targets
+    return parse_html(load_fixture(name), backend, targets)
+
+
+def benchmark_fixture(name: str, backend: str, repeats: int = 10, full_tree: bool = False) -> Dict:
+    source, _, extractors = FIXTURES[name]
+    scraper = ScraperFactory.create_scraper(source)
+    content = load_fixture(name)
+    targets = None if full_tree else scraper.parse_targets
+
+    soup = parse_html(content, backend, targets)
+    result = {
+        "fixture": name,
+        "backend": backend,
+        "targeted": targets is not None,
+        "bytes": len(content),
+        "parse_ms": _median_ms(lambda: parse_html(content, backend, targets), repeats),
+        "parse_allocations": _allocations_kb(lambda: parse_html(content, backend, targets)),
+        "extractors": {}
+    }
+
+    for method, kwargs in extractors:
+        extractor = getattr(scraper, method)
+        result["extractors"][method] = {
+            "select_ms": _median_ms(lambda: extractor(soup, **kwargs), repeats),
+            "allocations": _allocations_kb(lambda: extractor(soup, **kwargs)),
+            "items": len(extractor(soup, **kwargs))
+        }
+
+    result["select_ms"] = sum(stats["select_ms"] for stats in result["extractors"].values())
+    result["selectors"] = scraper.get_selector_stats()
+    return result
+
+
+def check_golden(names: List[str], backend: str, golden: Dict, full_tree: bool = False) -> List[Dict]:
+    mismatches = []
+    for name in names:
+        extracted = extract_all(name, parse_fixture(name, backend, full_tree))
+        for method, items in extracted.items():
+            expected = golden.get(name, {}).get(method)
+            if items != expected:
+                mismatches.append({
+                    "fixture": name,
+                    "backend": backend,
+                    "extractor": method,
+                    "missing": [item for item in (expected or []) if item not in items],
+                    "unexpected": [item for item in items if item not in (expected or [])],
+                    "order_only": expected is not None and sorted(items) == sorted(expected)
+                })
+    return mismatches
+
+
+def write_golden(names: List[str], reference_backend: str = "html.parser"):
+    golden = json.loads(GOLDEN_PATH.read_text(encoding="utf-8")) if GOLDEN_PATH.exists() else {}
+    for name in names:
+        golden[name] = extract_all(name, parse_fixture(name, reference_backend, full_tree=True))
+    GOLDEN_PATH.write_text(json.dumps(golden, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraper extractors against recorded HTML fixtures")
+    parser.add_argument("--fixtures", nargs="+", default=list(FIXTURES), choices=list(FIXTURES))
+    parser.add_argument("--backends", nargs="+", choices=PARSER_BACKENDS,
+                        help="Parser backends to compare (default: every installed one)")
+    parser.add_argument("--full-tree", action="store_true",
+                        help="Parse whole documents instead of only each scraper's declared parse targets")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--record", action="store_true",
+                        help="Fetch the live pages into the fixture directory and refresh the golden file first")
+    parser.add_argument("--update-golden", action="store_true",
+                        help="Rewrite the golden headline lists from the current fixtures using full-tree html.parser")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    names = args.fixtures
+    if args.record:
+        recorded = record_fixtures(names)
+        write_golden(recorded)
+    elif args.update_golden:
+        write_golden(names)
+
+    golden = json.loads(GOLDEN_PATH.read_text(encoding="utf-8")) if GOLDEN_PATH.exists() else {}
+    backends = args.backends or available_parser_backends()
+
+    report = {"results": [], "golden_mismatches": []}
+    for backend in backends:
+        for name in names:
+            report["results"].append(benchmark_fixture(name, backend, args.repeats, args.full_tree))
+        report["golden_mismatches"].extend(check_golden(names, backend, golden, args.full_tree))
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        console = Console()
+        table = Table(title="🧪 Extractor Parse Benchmark", show_header=True, header_style="bold magenta")
+        table.add_column("Fixture", style="bold cyan")
+        table.add_column("Backend", style="white")
+        table.add_column("Parse ms", style="yellow")
+        table.add_column("Select ms", style="yellow")
+        table.add_column("Parse Peak KB", style="green")
+        table.add_column("Items", style="white")
+
+        for result in report["results"]:
+            table.add_row(
+                result["fixture"],
+                result["backend"],
+                f"{result['parse_ms']:.2f}",
+                f"{result['select_ms']:.2f}",
+                f"{result['parse_allocations']['peak_kb']:.0f}",
+                str(sum(stats["items"] for stats in result["extractors"].values()))
+            )
+
+        console.print(table)
+        dead_selectors = {}
+        for result in report["results"]:
+            for plan, stats in result["selectors"].items():
+                dead = dead_selectors.setdefault((result["fixture"], plan), set(stats["dead"] + stats["invalid"]))
+                dead &= set(stats["dead"] + stats["invalid"])
+        for (fixture, plan), dead in dead_selectors.items():
+            if dead:
+                console.print(f"[yellow]⚠️  {fixture} / {plan}: {len(dead)} selectors never matched: "
+                              f"{escape(', '.join(sorted(dead)))}[/yellow]")
+        for mismatch in report["golden_mismatches"]:
+            console.print(f"[red]❌ {mismatch['fixture']} / {mismatch['extractor']} ({mismatch['backend']}) "
+                          f"differs from golden: {len(mismatch['missing'])} missing, "
+                          f"{len(mismatch['unexpected'])} unexpected[/red]")
+        if not report["golden_mismatches"]:
+            console.print("[green]✅ All extractors match the golden headline lists[/green]")
+
+    if report["golden_mismatches"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+from typing import Dict, List, Optional
+import json
+import re
+import numpy as np
+
+
+DEFAULT_FINANCIAL_KEYWORDS = {
+    "positive": [
+        "surge", "rally", "gains", "bullish", "upward", "growth", "profit", "earnings",
+        "outperform", "beat", "strong", "robust", "recovery", "boom", "soar", "climb",
+        "rise", "increase", "advance", "momentum", "optimistic", "confident", "upgrade"
+    ],
+    "negative": [
+        "plunge", "crash", "decline", "bearish", "downward", "loss", "deficit", "miss",
+        "underperform", "weak", "fragile", "recession", "slump", "fall", "drop",
+        "decrease", "retreat", "pessimistic", "concern", "worry", "downgrade", "risk"
+    ],
+    "neutral": [
+        "stable", "steady", "maintain", "hold", "unchanged", "flat", "sideways",
+        "consolidate", "range", "mixed", "moderate", "cautious", "watch", "monitor"
+    ]
+}
+
+def keyword_forms(keyword: str) -> List[str]:
+    bases = [keyword]
+    if keyword.endswith("s") and not keyword.endswith(("ss", "us", "ys")):
+        bases.append(keyword[:-1])
+
+    forms = []
+    for base in bases:
+        forms.append(base)
+        if re.search(r"(?:s|x|z|ch|sh)$", base):
+            forms.append(base + "es")
+        elif re.search(r"[^aeiou]y$", base):
+            forms.append(base[:-1] + "ies")
+        else:
+            forms.append(base + "s")
+
+        if re.search(r"[^aeiou]e$", base):
+            forms += [base + "d", base[:-1] + "ing"]
+        elif re.search(r"[^aeiou]y$", base):
+            forms += [base[:-1] + "ied", base + "ing"]
+        elif re.search(r"^[^aeiou]*[aeiou][bdgmnpt]$", base):
+            forms += [base + base[-1] + "ed", base + base[-1] + "ing"]
+        else:
+            forms += [base + "ed", base + "ing"]
+    return list(dict.fromkeys(forms))
+
+
+def _trie_pattern(words: List[str]) -> str:
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        optional = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if optional:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+def load_keywords(path: Optional[str] = None) -> Dict[str, List[str]]:
+    if not path:
+        return {category: list(keywords) for category, keywords in DEFAULT_FINANCIAL_KEYWORDS.items()}
+
+    with open(path, encoding="utf-8") as lexicon_file:
+        keywords = json.load(lexicon_file)
+
+    missing = [category for category in DEFAULT_FINANCIAL_KEYWORDS if category not in keywords]
+    if missing:
+        raise ValueError(f"Lexicon file {path} is missing categories: {missing}")
+    return {category: [keyword.lower() for keyword in keywords[category]] for category in DEFAULT_FINANCIAL_KEYWORDS}
+
+
+class FinancialLexicon:
+    def __init__(self, keywords: Dict[str, List[str]], categories: List[str] = None):
+        self.categories = categories or list(keywords.keys())
+        self.keyword_columns = {}
+        self.form_keywords = {}
+        for column, category in enumerate(self.categories):
+            for keyword in keywords.get(category, []):
+                keyword = keyword.lower()
+                self.keyword_columns.setdefault(keyword, column)
+                for form in keyword_forms(keyword):
+                    self.form_keywords.setdefault(form, keyword)
+
+        self.pattern = re.compile(r"\b(" + _trie_pattern(list(self.form_keywords)) + r")\b", re.IGNORECASE)
+        self.default_bias = np.array([0.34 if category == "neutral" else 0.33 for category in self.categories])
+
+    def match_keywords(self, text: str) -> List[str]:
+        return sorted({self.form_keywords[match.lower()] for match in self.pattern.findall(text)})
+
+    def count(self, text: str) -> np.ndarray:
+        counts = np.zeros(len(self.categories))
+        for keyword in self.match_keywords(text):
+            counts[self.keyword_columns[keyword]] += 1
+        return counts
+
+    def count_matrix(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), len(self.categories)))
+        for row, text in enumerate(texts):
+            for keyword in {self.form_keywords[match.lower()] for match in self.pattern.findall(text)}:
+                matrix[row, self.keyword_columns[keyword]] += 1
+        return matrix
+
+    def bias_matrix(self, texts: List[str]) -> np.ndarray:
+        counts = self.count_matrix(texts)
+        totals = counts.sum(axis=1, keepdims=True)
+        return np.where(totals > 0, counts / np.maximum(totals, 1), self.default_bias)
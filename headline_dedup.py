@@ -0,0 +1,112 @@
+from typing import Dict, List, Optional, Tuple
+import re
+import zlib
+import numpy as np
+from financial_lexicon import FinancialLexicon, load_keywords
+
+
+PUBLISHER_SUFFIX = re.compile(r"\s+[-–—|]\s+(?:[A-Z][\w.&']*\s?){1,4}$")
+NON_WORD = re.compile(r"[^\w\s%$]")
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_headline(text: str) -> str:
+    text = text.strip()
+    suffix = PUBLISHER_SUFFIX.search(text)
+    if suffix and len(text[:suffix.start()].split()) >= 4:
+        text = text[:suffix.start()]
+    text = NON_WORD.sub(" ", text.lower())
+    return " ".join(text.split())
+
+
+def headline_shingles(text: str) -> set:
+    words = normalize_headline(text).split()
+    if len(words) < 2:
+        return set(words)
+    return {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+class HeadlineDeduplicator:
+    def __init__(self, threshold: float = 0.95, num_perm: int = 64, bands: int = 16, seed: int = 1,
+                 lexicon: Optional[FinancialLexicon] = None):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Similarity threshold must be in (0, 1], got {threshold}")
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.lexicon = lexicon or FinancialLexicon(load_keywords(), ["negative", "neutral", "positive"])
+
+        rng = np.random.default_rng(seed)
+        self.hash_a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.hash_b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.texts_seen = 0
+        self.clusters_seen = 0
+
+    def _signature(self, tokens: set) -> np.ndarray:
+        token_hashes = np.fromiter((zlib.crc32(token.encode("utf-8")) for token in tokens),
+                                   dtype=np.uint64, count=len(tokens))
+        hashed = (self.hash_a[:, None] * token_hashes[None, :] + self.hash_b[:, None]) % MERSENNE_PRIME
+        return hashed.min(axis=1)
+
+    def cluster(self, texts: List[str]) -> Tuple[List[int], np.ndarray]:
+        token_sets = [headline_shingles(text) for text in texts]
+        polarities = [row.tobytes() for row in self.lexicon.count_matrix(texts)]
+        parents = list(range(len(texts)))
+
+        def find(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        buckets: Dict[Tuple, List[int]] = {}
+        for index, tokens in enumerate(token_sets):
+            if not tokens:
+                continue
+            signature = self._signature(tokens)
+            for band in range(self.bands):
+                bucket = buckets.setdefault((band, signature[band * self.rows:(band + 1) * self.rows].tobytes()), [])
+                for candidate in bucket:
+                    root, candidate_root = find(index), find(candidate)
+                    if root == candidate_root or polarities[index] != polarities[candidate]:
+                        continue
+                    other = token_sets[candidate]
+                    if len(tokens & other) / len(tokens | other) >= self.threshold:
+                        parents[max(root, candidate_root)] = min(root, candidate_root)
+                bucket.append(index)
+
+        representatives = []
+        cluster_ids = {}
+        labels = np.empty(len(texts), dtype=np.int64)
+        for index in range(len(texts)):
+            root = find(index)
+            if root not in cluster_ids:
+                cluster_ids[root] = len(representatives)
+                representatives.append(root)
+            labels[index] = cluster_ids[root]
+
+        self.texts_seen += len(texts)
+        self.clusters_seen += len(representatives)
+        return representatives, labels
+
+    def get_stats(self) -> Dict[str, float]:
+        saved = self.texts_seen - self.clusters_seen
+        return {
+            "threshold": self.threshold,
+            "texts": self.texts_seen,
+            "clusters": self.clusters_seen,
+            "inferences_saved": saved,
+            "saved_ratio": saved / self.texts_seen if self.texts_seen > 0 else 0.0
+        }
+
+
+def create_deduplicator(threshold: Optional[float],
+                        lexicon: Optional[FinancialLexicon] = None) -> Optional[HeadlineDeduplicator]:
+    return HeadlineDeduplicator(threshold, lexicon=lexicon) if threshold else None
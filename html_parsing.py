@@ -0,0 +1,72 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Union
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+
+PARSER_BACKENDS = ["lxml", "html.parser"]
+
+
+class ParseTargets:
+    def __init__(self, tags: Iterable[str] = (), classes: Iterable[str] = (), attributes: Iterable[str] = ()):
+        self.tags = frozenset(tags)
+        self.classes = frozenset(classes)
+        self.attributes = frozenset(attributes)
+
+    def matches(self, name: str, attrs: Optional[Dict]) -> bool:
+        if name in self.tags:
+            return True
+        if not attrs:
+            return False
+        if self.attributes.intersection(attrs):
+            return True
+        class_value = attrs.get("class") or ""
+        class_names = class_value.split() if isinstance(class_value, str) else class_value
+        return not self.classes.isdisjoint(class_names)
+
+    def strainer(self) -> SoupStrainer:
+        return TargetStrainer(self)
+
+
+class TargetStrainer(SoupStrainer):
+    def __init__(self, targets: ParseTargets):
+        super().__init__()
+        self.targets = targets
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict]) -> bool:
+        return self.targets.matches(name, attrs)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _is_installed(backend: str) -> bool:
+    try:
+        BeautifulSoup("<p></p>", backend)
+        return True
+    except FeatureNotFound:
+        return False
+
+
+def available_parser_backends() -> List[str]:
+    return [backend for backend in PARSER_BACKENDS if _is_installed(backend)]
+
+
+def default_parser_backend() -> str:
+    return available_parser_backends()[0]
+
+
+def resolve_parser_backend(backend: Optional[str] = None) -> str:
+    if backend in (None, "auto"):
+        return default_parser_backend()
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unsupported parser backend: {backend}. Available: {PARSER_BACKENDS}")
+    if not _is_installed(backend):
+        print(f"Warning: parser backend '{backend}' is not installed (pip install {backend}); using html.parser")
+        return "html.parser"
+    return backend
+
+
+def parse_html(content: Union[str, bytes], backend: str = "html.parser",
+               targets: Optional[ParseTargets] = None) -> BeautifulSoup:
+    return BeautifulSoup(content, backend, parse_only=targets.strainer() if targets else None)
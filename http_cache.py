@@ -0,0 +1,257 @@
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import inspect
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+DEFAULT_HTTP_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "twsm", "http_cache.sqlite")
+MAX_AGE_DIRECTIVE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def _header(headers: Dict[str, str], name: str) -> Optional[str]:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def parse_cache_control(headers: Dict[str, str], now: float) -> Tuple[bool, float]:
+    cache_control = (_header(headers, "cache-control") or "").lower()
+    if "no-store" in cache_control:
+        return False, 0.0
+    if "no-cache" in cache_control:
+        return True, 0.0
+    match = MAX_AGE_DIRECTIVE.search(cache_control)
+    return True, now + int(match.group(1)) if match else 0.0
+
+
+_code_digests: Dict[str, str] = {}
+
+
+def code_digest(*modules) -> Optional[str]:
+    digest = hashlib.sha256()
+    for module in modules:
+        if module.__name__ not in _code_digests:
+            try:
+                source = inspect.getsource(module)
+            except (OSError, TypeError):
+                return None
+            _code_digests[module.__name__] = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        digest.update(_code_digests[module.__name__].encode("ascii"))
+    return digest.hexdigest()
+
+
+class HttpCache:
+    def __init__(self, db_path: Optional[str] = DEFAULT_HTTP_CACHE_PATH, max_entries: int = 500,
+                 max_age_seconds: float = 7 * 24 * 3600, max_memory_entries: int = 64):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.max_memory_entries = max_memory_entries
+        self.memory: OrderedDict[str, Tuple] = OrderedDict()
+        self.extracted: Dict[str, Tuple[str, Dict]] = {}
+        self.lock = threading.Lock()
+        self.connection = None
+        self.stats = defaultdict(lambda: {"requests": 0, "not_modified": 0, "fresh_hits": 0, "bytes_downloaded": 0,
+                                          "bytes_saved": 0, "extractions_reused": 0})
+        self._open()
+
+    def _open(self):
+        if not self.db_path:
+            return
+        try:
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, expires_at REAL, body BLOB, stored_at REAL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS extracted_news (source TEXT PRIMARY KEY, signature TEXT, news TEXT)"
+            )
+            self.connection.commit()
+            self.prune()
+        except sqlite3.Error as e:
+            print(f"Warning: HTTP cache disabled on disk ({e})")
+            self.connection = None
+
+    def _remember(self, url: str, entry: Tuple):
+        self.memory[url] = entry
+        self.memory.move_to_end(url)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def _lookup(self, url: str) -> Optional[Tuple]:
+        entry = self.memory.get(url)
+        if entry is not None:
+            self.memory.move_to_end(url)
+        elif self.connection:
+            try:
+                entry = self.connection.execute(
+                    "SELECT etag, last_modified, expires_at, body, stored_at FROM http_cache WHERE url = ?", (url,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"Warning: HTTP cache error: {e}")
+            if entry is not None:
+                self._remember(url, entry)
+        if entry is not None and time.time() - entry[4] > self.max_age_seconds:
+            return None
+        return entry
+
+    def _store(self, url: str, entry: Tuple):
+        self._remember(url, entry)
+        if not self.connection:
+            return
+        try:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, expires_at, body, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (url, *entry)
+            )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: HTTP cache error: {e}")
+
+    def conditional_request(self, source: str, url: str) -> Tuple[Optional[bytes], Dict[str, str]]:
+        with self.lock:
+            entry = self._lookup(url)
+            if entry is None:
+                return None, {}
+
+            etag, last_modified, expires_at, body, _ = entry
+            if time.time() < expires_at:
+                self.stats[source]["fresh_hits"] += 1
+                self.stats[source]["bytes_saved"] += len(body)
+                return body, {}
+
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            return None, headers
+
+    def resolve_response(self, source: str, url: str, status: int, headers: Dict[str, str],
+                         body: bytes) -> Optional[bytes]:
+        now = time.time()
+        storable, expires_at = parse_cache_control(headers, now)
+        with self.lock:
+            stats = self.stats[source]
+            stats["requests"] += 1
+            stats["bytes_downloaded"] += len(body or b"")
+
+            if status == 304:
+                entry = self._lookup(url)
+                if entry is None:
+                    return None
+                etag, last_modified, _, cached_body, _ = entry
+                stats["not_modified"] += 1
+                stats["bytes_saved"] += len(cached_body)
+                self._store(url, (_header(headers, "etag") or etag, _header(headers, "last-modified") or last_modified,
+                                  expires_at, cached_body, now))
+                return cached_body
+
+            if status != 200:
+                return None
+
+            etag = _header(headers, "etag")
+            last_modified = _header(headers, "last-modified")
+            if storable and (etag or last_modified or expires_at > now):
+                self._store(url, (etag, last_modified, expires_at, body, now))
+            return body
+
+    @staticmethod
+    def content_signature(contents: List[Optional[bytes]], extractor_version: Optional[str]) -> Optional[str]:
+        if extractor_version is None or any(content is None for content in contents):
+            return None
+        digest = hashlib.sha256(extractor_version.encode("utf-8"))
+        for content in contents:
+            digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    def get_extracted(self, source: str, signature: Optional[str]) -> Optional[Dict[str, List[str]]]:
+        if signature is None:
+            return None
+        with self.lock:
+            entry = self.extracted.get(source)
+            if entry is None and self.connection:
+                try:
+                    row = self.connection.execute(
+                        "SELECT signature, news FROM extracted_news WHERE source = ?", (source,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Warning: HTTP cache error: {e}")
+                    row = None
+                if row:
+                    entry = (row[0], json.loads(row[1]))
+                    self.extracted[source] = entry
+            if entry is None or entry[0] != signature:
+                return None
+            self.stats[source]["extractions_reused"] += 1
+            return entry[1]
+
+    def put_extracted(self, source: str, signature: Optional[str], news: Dict[str, List[str]]):
+        if signature is None:
+            return
+        with self.lock:
+            self.extracted[source] = (signature, news)
+            if not self.connection:
+                return
+            try:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO extracted_news (source, signature, news) VALUES (?, ?, ?)",
+                    (source, signature, json.dumps(news, ensure_ascii=False))
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: HTTP cache error: {e}")
+
+    def prune(self):
+        cutoff = time.time() - self.max_age_seconds
+        with self.lock:
+            self.memory = OrderedDict((url, entry) for url, entry in self.memory.items() if entry[4] >= cutoff)
+            if not self.connection:
+                return
+            try:
+                self.connection.execute("DELETE FROM http_cache WHERE stored_at < ?", (cutoff,))
+                self.connection.execute(
+                    "DELETE FROM http_cache WHERE url NOT IN "
+                    "(SELECT url FROM http_cache ORDER BY stored_at DESC LIMIT ?)", (self.max_entries,)
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: HTTP cache error: {e}")
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            self.extracted.clear()
+            if not self.connection:
+                return
+            try:
+                self.connection.execute("DELETE FROM http_cache")
+                self.connection.execute("DELETE FROM extracted_news")
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: HTTP cache error: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        with self.lock:
+            return {
+                source: {
+                    **stats,
+                    "not_modified_rate": stats["not_modified"] / stats["requests"] if stats["requests"] else 0.0
+                }
+                for source, stats in self.stats.items()
+            }
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
+            self.connection = None
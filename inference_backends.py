@@ -0,0 +1,161 @@
+from transformers import AutoConfig, AutoTokenizer, AutoModelForSequenceClassification
+from abc import ABC, abstractmethod
+from typing import List, Optional
+import os
+import numpy as np
+import torch
+from sentiment_cache import model_fingerprint
+
+
+DEFAULT_ONNX_DIR = os.path.join(os.path.expanduser("~"), ".cache", "twsm", "onnx")
+
+
+class InferenceBackend(ABC):
+    def __init__(self, model_name: str, device: str = "cpu", precision: str = "fp32", num_threads: Optional[int] = None):
+        self.model_name = model_name
+        self.device = device
+        self.precision = precision
+        self.num_threads = num_threads
+        self.tokenizer = None
+        self.revision = None
+
+    @abstractmethod
+    def predict(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        pass
+
+
+class TorchBackend(InferenceBackend):
+    def __init__(self, model_name: str, device: str = "cpu", precision: str = "fp32", num_threads: Optional[int] = None):
+        super().__init__(model_name, device, precision, num_threads)
+        if num_threads:
+            torch.set_num_threads(num_threads)
+
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.revision = model_fingerprint(model.config, self.tokenizer)
+
+        model.to(device)
+        model.eval()
+
+        if precision == "int8":
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif precision == "bf16":
+            model = model.to(torch.bfloat16)
+
+        self.model = model
+
+    def predict(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        if self.num_threads and torch.get_num_threads() != self.num_threads:
+            torch.set_num_threads(self.num_threads)
+        with torch.no_grad():
+            output = self.model(
+                input_ids=torch.from_numpy(input_ids).to(self.device),
+                attention_mask=torch.from_numpy(attention_mask).to(self.device)
+            )
+        return output.logits.detach().float().cpu().numpy()
+
+
+class OnnxBackend(InferenceBackend):
+    def __init__(self, model_name: str, device: str = "cpu", precision: str = "fp32", num_threads: Optional[int] = None,
+                 export_dir: str = DEFAULT_ONNX_DIR):
+        super().__init__(model_name, device, precision, num_threads)
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            raise ImportError("The onnx backend requires onnxruntime: pip install onnxruntime")
+
+        if precision == "bf16":
+            raise ValueError("The onnx backend supports fp32 and int8 precision only")
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        config = AutoConfig.from_pretrained(model_name)
+        self.revision = model_fingerprint(config, self.tokenizer)
+
+        model_path = self.export_model(model_name, self.revision, export_dir)
+        if precision == "int8":
+            model_path = self.quantize_model(model_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        providers = ["CPUExecutionProvider"]
+        if device.startswith("cuda"):
+            providers.insert(0, "CUDAExecutionProvider")
+
+        self.model_path = model_path
+        self.session = ort.InferenceSession(model_path, options, providers=providers)
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+
+    @staticmethod
+    def export_path(model_name: str, revision: str, export_dir: str = DEFAULT_ONNX_DIR) -> str:
+        safe_name = model_name.strip("/").replace("/", "__")
+        return os.path.join(export_dir, safe_name, revision, "model.onnx")
+
+    @classmethod
+    def export_model(cls, model_name: str, revision: str, export_dir: str = DEFAULT_ONNX_DIR) -> str:
+        model_path = cls.export_path(model_name, revision, export_dir)
+        if os.path.exists(model_path):
+            return model_path
+
+        print(f"Exporting {model_name} to ONNX (one-time)...")
+        os.makedirs(os.path.dirname(model_path), exist_ok=True)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+
+        dummy_ids = torch.ones((2, 8), dtype=torch.long)
+        dummy_mask = torch.ones((2, 8), dtype=torch.long)
+        temp_path = f"{model_path}.tmp"
+
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (dummy_ids, dummy_mask),
+                temp_path,
+                input_names=["input_ids", "attention_mask"],
+                output_names=["logits"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "logits": {0: "batch"}
+                },
+                opset_version=17,
+                dynamo=False
+            )
+
+        os.replace(temp_path, model_path)
+        return model_path
+
+    @staticmethod
+    def quantize_model(model_path: str) -> str:
+        quantized_path = model_path.replace("model.onnx", "model.int8.onnx")
+        if os.path.exists(quantized_path):
+            return quantized_path
+
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        temp_path = f"{quantized_path}.tmp"
+        quantize_dynamic(model_path, temp_path, weight_type=QuantType.QInt8)
+        os.replace(temp_path, quantized_path)
+        return quantized_path
+
+    def predict(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        return self.session.run(["logits"], {name: feeds[name] for name in self.input_names})[0]
+
+
+class BackendFactory:
+    _backends = {
+        "torch": TorchBackend,
+        "onnx": OnnxBackend
+    }
+
+    @classmethod
+    def create_backend(cls, backend: str, model_name: str, device: str = "cpu", precision: str = "fp32",
+                       num_threads: Optional[int] = None) -> InferenceBackend:
+        if backend.lower() not in cls._backends:
+            raise ValueError(f"Unsupported backend: {backend}. Available: {list(cls._backends.keys())}")
+        return cls._backends[backend.lower()](model_name, device, precision, num_threads)
+
+    @classmethod
+    def get_available_backends(cls) -> List[str]:
+        return list(cls._backends.keys())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+from rich.console import Console
+from rich.table import Table
+from financial_lexicon import FinancialLexicon, load_keywords
+
+
+DEFAULT_CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_data", "headlines.txt")
+
+INFLECTION_EXAMPLES = {
+    "dropped": "drop", "rallied": "rally", "rallies": "rally", "surging": "surge", "declining": "decline",
+    "worries": "worry", "risks": "risk", "gained": "gains", "rising": "rise", "losses": "loss", "holds": "hold",
+    "ranging": "range", "crashes": "crash", "watched": "watch"
+}
+
+NEGATIVE_EXAMPLES = [
+    "Ranger", "rang", "ris", "Missy", "Flatter", "watchers", "holder", "enterprise", "inflation", "upbeat"
+]
+
+
+def load_corpus(path: Optional[str] = None) -> List[str]:
+    with open(path or DEFAULT_CORPUS_PATH, encoding="utf-8") as corpus_file:
+        return [line.strip() for line in corpus_file if line.strip()]
+
+
+def baseline_keywords(keywords: Dict[str, List[str]], text: str) -> List[str]:
+    text_lower = text.lower()
+    return sorted({keyword for category in keywords.values() for keyword in category if keyword in text_lower})
+
+
+def run_lexicon_check(texts: List[str], lexicon_path: Optional[str] = None) -> Dict:
+    keywords = load_keywords(lexicon_path)
+    lexicon = FinancialLexicon(keywords, ["negative", "neutral", "positive"])
+
+    baseline_hits = Counter()
+    lexicon_hits = Counter()
+    missed_words = defaultdict(Counter)
+    for text in texts:
+        baseline = set(baseline_keywords(keywords, text))
+        matched = set(lexicon.match_keywords(text))
+        baseline_hits.update(baseline)
+        lexicon_hits.update(matched)
+        for keyword in baseline - matched:
+            for word in re.findall(r"\w*" + re.escape(keyword) + r"\w*", text.lower()):
+                missed_words[keyword][word] += 1
+
+    failed_examples = {word: keyword for word, keyword in INFLECTION_EXAMPLES.items()
+                       if keyword in lexicon.keyword_columns and keyword not in lexicon.match_keywords(word)}
+    false_hits = {text: lexicon.match_keywords(text) for text in NEGATIVE_EXAMPLES if lexicon.match_keywords(text)}
+
+    return {
+        "texts": len(texts),
+        "baseline_matches": sum(baseline_hits.values()),
+        "lexicon_matches": sum(lexicon_hits.values()),
+        "keywords": {
+            keyword: {"baseline": baseline_hits[keyword], "lexicon": lexicon_hits[keyword],
+                      "missed_words": dict(missed_words[keyword].most_common(5))}
+            for keyword in sorted(set(baseline_hits) | set(lexicon_hits))
+        },
+        "failed_inflections": failed_examples,
+        "false_hits": false_hits
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare compiled lexicon matches with the baseline substring counts")
+    parser.add_argument("--corpus", help="Text file with one headline per line (defaults to benchmark_data/headlines.txt)")
+    parser.add_argument("--lexicon", help="JSON lexicon file (defaults to the built-in keywords)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run_lexicon_check(load_corpus(args.corpus), args.lexicon)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        console = Console()
+        table = Table(title="📖 Lexicon vs Baseline Substring Matching", show_header=True, header_style="bold magenta")
+        table.add_column("Keyword", style="bold cyan")
+        table.add_column("Baseline", style="white")
+        table.add_column("Lexicon", style="green")
+        table.add_column("Baseline-only Words", style="yellow")
+
+        for keyword, stats in report["keywords"].items():
+            if stats["baseline"] == stats["lexicon"] and not stats["missed_words"]:
+                continue
+            missed = ", ".join(f"{word} ({count})" for word, count in stats["missed_words"].items())
+            table.add_row(keyword, str(stats["baseline"]), str(stats["lexicon"]), missed or "-")
+
+        console.print(table)
+        console.print(f"{report['texts']} headlines: {report['baseline_matches']} baseline keyword matches, "
+                      f"{report['lexicon_matches']} lexicon keyword matches")
+
+    if report["failed_inflections"]:
+        print(f"Inflections not matched: {report['failed_inflections']}")
+    if report["false_hits"]:
+        print(f"Words that should not match: {report['false_hits']}")
+    if report["failed_inflections"] or report["false_hits"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
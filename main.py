@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -7,11 +8,20 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from cli import FinancialCLI
+from inference_backends import BackendFactory
+from html_parsing import PARSER_BACKENDS
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Financial News Analyzer")
+    parser.add_argument("--backend", default="torch", choices=BackendFactory.get_available_backends(),
+                        help="Inference backend for the sentiment model")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS,
+                        help="HTML parser backend (default: the fastest installed one)")
+    args = parser.parse_args()
+
     try:
-        app = FinancialCLI()
+        app = FinancialCLI(backend=args.backend, parser_backend=args.parser)
         app.run()
     except KeyboardInterrupt:
         return
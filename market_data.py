@@ -0,0 +1,135 @@
+from typing import Dict, List, Optional
+import re
+import numpy as np
+
+
+MARKET_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<pct>\(?[+\-−]?\d[\d,]*(?:\.\d+)?\s?%\)?)"
+    r"|(?P<num>\(?[+\-−]?[$₹€£]?\d[\d,]*(?:\.\d+)?\)?)"
+    r"|(?P<word>[A-Za-z^&][\w^&.\-/]*)"
+    r"|(?P<sep>[|·:,])"
+    r"|(?P<other>\S)"
+    r")"
+)
+MAX_SYMBOL_WORDS = 4
+FLAT_PCT_CHANGE = 0.05
+
+
+def _to_float(token: str) -> float:
+    return float(re.sub(r"[()%\s,$₹€£]", "", token).replace("−", "-"))
+
+
+def _is_signed(token: str) -> bool:
+    return token.lstrip("(")[:1] in "+-−"
+
+
+class MarketDataRecord:
+    def __init__(self, text: str, symbol: Optional[str] = None, price: Optional[float] = None,
+                 change: Optional[float] = None, pct_change: Optional[float] = None):
+        self.text = text
+        self.symbol = symbol
+        self.price = price
+        self.change = change
+        self.pct_change = pct_change
+
+    def to_dict(self) -> Dict[str, any]:
+        return {
+            "text": self.text,
+            "symbol": self.symbol,
+            "price": self.price,
+            "change": self.change,
+            "pct_change": self.pct_change
+        }
+
+    def __repr__(self) -> str:
+        return (f"MarketDataRecord(symbol={self.symbol!r}, price={self.price}, change={self.change}, "
+                f"pct_change={self.pct_change})")
+
+
+def parse_market_data(text: str) -> Optional[MarketDataRecord]:
+    symbol_words = []
+    numbers = []
+    pct_change = None
+    pct_signed = False
+
+    for match in MARKET_TOKEN.finditer(text):
+        kind = match.lastgroup
+        token = match.group(kind)
+        if kind == "other":
+            return None
+        if kind == "sep":
+            continue
+        if kind == "word":
+            if numbers or pct_change is not None or len(symbol_words) >= MAX_SYMBOL_WORDS:
+                return None
+            if not token[0].isupper() and token[0] not in "^&":
+                return None
+            symbol_words.append(token)
+        elif kind == "pct":
+            if pct_change is not None:
+                return None
+            pct_change = _to_float(token)
+            pct_signed = _is_signed(token)
+        else:
+            numbers.append(token)
+
+    if not numbers and pct_change is None:
+        return None
+
+    unsigned = [token for token in numbers if not _is_signed(token)]
+    if symbol_words and len(unsigned) > 1 and unsigned[0].isdigit() and numbers[0] == unsigned[0]:
+        symbol_words.append(numbers.pop(0))
+
+    price = None
+    change = None
+    decimal_price = False
+    for token in numbers:
+        signed = _is_signed(token)
+        if signed and change is None:
+            change = _to_float(token)
+        elif not signed and price is None:
+            price = _to_float(token)
+            decimal_price = "." in token
+        else:
+            return None
+
+    if pct_change is not None and not pct_signed:
+        if change is None:
+            return None
+        pct_change = float(np.copysign(pct_change, change))
+    if change is None and not pct_signed and not decimal_price:
+        return None
+
+    return MarketDataRecord(text, " ".join(symbol_words) or None, price, change, pct_change)
+
+
+def parse_market_batch(texts: List[str]) -> List[Optional[MarketDataRecord]]:
+    return [parse_market_data(text) for text in texts]
+
+
+def market_data_scores(records: List[MarketDataRecord]) -> np.ndarray:
+    def column(name: str) -> np.ndarray:
+        return np.array([getattr(record, name) if getattr(record, name) is not None else np.nan for record in records],
+                        dtype=np.float64)
+
+    price, change, pct_change = column("price"), column("change"), column("pct_change")
+
+    previous_close = price - change
+    derived_pct = np.divide(change * 100, previous_close, out=np.full(len(records), np.nan),
+                            where=np.isfinite(previous_close) & (previous_close > 0))
+    pct = np.where(np.isfinite(pct_change), pct_change, derived_pct)
+    direction = np.where(np.isfinite(change), np.sign(np.nan_to_num(change)), np.sign(np.nan_to_num(pct)))
+    direction = np.where(np.isfinite(pct) & (np.abs(np.nan_to_num(pct)) < FLAT_PCT_CHANGE), 0, direction)
+
+    magnitude = np.where(np.isfinite(pct), np.abs(np.nan_to_num(pct)), 0.5)
+    confidence = 0.5 + 0.45 * np.tanh(magnitude / 2)
+
+    scores = np.empty((len(records), 3))
+    scores[:, 0] = np.where(direction < 0, confidence, (1 - confidence) / 2)
+    scores[:, 2] = np.where(direction > 0, confidence, (1 - confidence) / 2)
+    scores[:, 1] = np.where(direction == 0, 0.6, (1 - confidence) / 2)
+    flat = direction == 0
+    scores[flat, 0] = 0.2
+    scores[flat, 2] = 0.2
+    return scores
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+from rich.console import Console
+from rich.table import Table
+from market_data import market_data_scores, parse_market_data
+
+
+DEFAULT_CASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_data", "market_data_cases.json")
+LABELS = ["Negative", "Neutral", "Positive"]
+
+
+def load_cases(path: Optional[str] = None) -> List[Dict]:
+    with open(path or DEFAULT_CASES_PATH, encoding="utf-8") as cases_file:
+        return json.load(cases_file)
+
+
+def run_market_data_check(cases: List[Dict]) -> Dict:
+    results = []
+    for case in cases:
+        record = parse_market_data(case["text"])
+        label = LABELS[int(market_data_scores([record])[0].argmax())] if record is not None else None
+        results.append({
+            "text": case["text"],
+            "expected": case["label"],
+            "label": label,
+            "record": record.to_dict() if record is not None else None,
+            "ok": label == case["label"]
+        })
+
+    return {
+        "cases": len(results),
+        "failures": sum(not result["ok"] for result in results),
+        "results": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check which strings are scored as market data and their direction")
+    parser.add_argument("--cases", help="JSON case file (defaults to benchmark_data/market_data_cases.json)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run_market_data_check(load_cases(args.cases))
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        console = Console()
+        table = Table(title="📈 Market Data Parsing", show_header=True, header_style="bold magenta")
+        table.add_column("Text", style="bold cyan")
+        table.add_column("Expected", style="white")
+        table.add_column("Scored", style="green")
+        table.add_column("", style="white")
+
+        for result in report["results"]:
+            table.add_row(result["text"], result["expected"] or "model", result["label"] or "model",
+                          "✅" if result["ok"] else "❌")
+
+        console.print(table)
+        console.print(f"{report['cases']} cases, {report['failures']} failures")
+
+    if report["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
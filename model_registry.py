@@ -0,0 +1,80 @@
+from typing import Dict, Optional, Tuple
+import threading
+import torch
+from inference_backends import BackendFactory, InferenceBackend
+
+
+SUPPORTED_PRECISIONS = ["fp32", "int8", "bf16"]
+
+
+def bf16_supported() -> bool:
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        pass
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            flags = cpuinfo.read()
+        return "avx512_bf16" in flags or "amx_bf16" in flags
+    except OSError:
+        return False
+
+
+def resolve_precision(precision: str, device: str = "cpu") -> str:
+    if precision not in SUPPORTED_PRECISIONS:
+        raise ValueError(f"Unsupported precision: {precision}. Available: {SUPPORTED_PRECISIONS}")
+    if precision == "int8" and device != "cpu":
+        raise ValueError("int8 dynamic quantization is only available on CPU")
+    if precision == "bf16" and device == "cpu" and not bf16_supported():
+        print("Warning: bf16 is not supported on this CPU, falling back to fp32")
+        return "fp32"
+    return precision
+
+
+class ModelRegistry:
+    _entries = {}
+    _key_locks = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _key_lock(cls, key: Tuple[str, str, str, str, Optional[int]]) -> threading.Lock:
+        with cls._lock:
+            if key not in cls._key_locks:
+                cls._key_locks[key] = threading.Lock()
+            return cls._key_locks[key]
+
+    @classmethod
+    def acquire(cls, model_name: str, device: str = "cpu", precision: str = "fp32",
+                backend: str = "torch", num_threads: Optional[int] = None) -> InferenceBackend:
+        key = (model_name, device, precision, backend, num_threads)
+
+        with cls._key_lock(key):
+            with cls._lock:
+                entry = cls._entries.get(key)
+                if entry is not None:
+                    entry["refcount"] += 1
+                    return entry["backend"]
+
+            inference_backend = BackendFactory.create_backend(backend, model_name, device, precision, num_threads)
+
+            with cls._lock:
+                cls._entries[key] = {"backend": inference_backend, "refcount": 1}
+            return inference_backend
+
+    @classmethod
+    def release(cls, model_name: str, device: str = "cpu", precision: str = "fp32", backend: str = "torch",
+                num_threads: Optional[int] = None):
+        key = (model_name, device, precision, backend, num_threads)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return
+            entry["refcount"] -= 1
+            if entry["refcount"] <= 0:
+                del cls._entries[key]
+
+    @classmethod
+    def get_loaded_models(cls) -> Dict[str, int]:
+        with cls._lock:
+            return {f"{name} [{backend}, {device}, {precision}, threads={num_threads or 'default'}]": entry["refcount"]
+                    for (name, device, precision, backend, num_threads), entry in cls._entries.items()}
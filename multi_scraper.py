@@ -3,36 +3,112 @@ from bs4 import BeautifulSoup
 from typing import List, Dict, Optional, Union
 import time
 from abc import ABC, abstractmethod
-import json
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
 import re
+import sys
+from rate_limiter import DEFAULT_RATE_LIMITER, HostRateLimiter
+from http_cache import HttpCache, code_digest
+from seen_index import SeenHeadlineIndex
+import selector_plans
+import html_parsing
+from selector_plans import SelectorPlan
+from html_parsing import ParseTargets, parse_html, resolve_parser_backend
 
 
 class BaseScraper(ABC):
-    def __init__(self, source_name: str):
+    parse_targets: Optional[ParseTargets] = None
+
+    def __init__(self, source_name: str, rate_limiter: Optional[HostRateLimiter] = None,
+                 http_cache: Optional[HttpCache] = None, parser_backend: Optional[str] = None):
         self.source_name = source_name
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.http_cache = http_cache
+        self.parser_backend = resolve_parser_backend(parser_backend)
+        self.selector_plans: Dict[str, SelectorPlan] = {}
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_content(self, url: str) -> Optional[bytes]:
+        headers = {}
+        if self.http_cache:
+            cached, headers = self.http_cache.conditional_request(self.source_name, url)
+            if cached is not None:
+                return cached
+
+        self.rate_limiter.acquire(url)
         try:
-            response = self.session.get(url, timeout=15)
-            if response.status_code == 200:
-                return BeautifulSoup(response.content, "html.parser")
-            else:
-                print(f"Failed to retrieve {self.source_name}: {response.status_code}")
-                return None
+            response = self.session.get(url, timeout=15, headers=headers)
         except requests.RequestException as e:
             print(f"Error fetching {self.source_name}: {e}")
             return None
 
+        if self.http_cache:
+            content = self.http_cache.resolve_response(self.source_name, url, response.status_code,
+                                                       response.headers, response.content)
+        else:
+            content = response.content if response.status_code == 200 else None
+        if content is None:
+            print(f"Failed to retrieve {self.source_name}: {response.status_code}")
+        return content
+
+    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        content = self.fetch_content(url)
+        return self.parse_page(content) if content is not None else None
+
+    def parse_page(self, content: Union[str, bytes]) -> BeautifulSoup:
+        return parse_html(content, self.parser_backend, self.parse_targets)
+
+    def fetch_pages(self, urls: List[str]) -> List[Optional[BeautifulSoup]]:
+        return [self.parse_page(content) if content is not None else None for content in self.fetch_contents(urls)]
+
+    def fetch_contents(self, urls: List[str]) -> List[Optional[bytes]]:
+        if len(urls) < 2:
+            return [self.fetch_content(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix=f"fetch-{self.source_name}") as executor:
+            return list(executor.map(self.fetch_content, urls))
+
+    def extractor_version(self) -> Optional[str]:
+        code = code_digest(sys.modules[type(self).__module__], selector_plans, html_parsing)
+        return f"{type(self).__name__}:{self.parser_backend}:{code}" if code else None
+
+    def extract_contents(self, contents: List[Optional[bytes]]) -> Dict[str, List[str]]:
+        signature = HttpCache.content_signature(contents, self.extractor_version()) if self.http_cache else None
+        if signature:
+            cached = self.http_cache.get_extracted(self.source_name, signature)
+            if cached is not None:
+                return cached
+
+        news = self.extract_news([self.parse_page(content) if content is not None else None for content in contents])
+        if signature:
+            self.http_cache.put_extracted(self.source_name, signature, news)
+        return news
+
     @abstractmethod
-    def scrape_news(self) -> Dict[str, List[str]]:
+    def get_page_urls(self) -> List[str]:
+        pass
+
+    @abstractmethod
+    def extract_news(self, soups: List[Optional[BeautifulSoup]]) -> Dict[str, List[str]]:
         pass
 
+    def scrape_news(self) -> Dict[str, List[str]]:
+        return self.extract_contents(self.fetch_contents(self.get_page_urls()))
+
+    def add_selector_plan(self, name: str, selectors: List[str], accept=None, limit: Optional[int] = None) -> SelectorPlan:
+        self.selector_plans[name] = SelectorPlan(name, selectors, accept, limit)
+        return self.selector_plans[name]
+
+    def get_selector_stats(self) -> Dict[str, Dict]:
+        return {name: plan.get_stats() for name, plan in self.selector_plans.items()}
+
     def get_news_with_metadata(self) -> Dict[str, any]:
-        news_data = self.scrape_news()
+        return self.wrap_metadata(self.scrape_news())
+
+    def wrap_metadata(self, news_data: Dict[str, List[str]]) -> Dict[str, any]:
         return {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "source": self.source_name,
@@ -43,6 +119,8 @@ class BaseScraper(ABC):
 
 
 class LiveMintScraper(BaseScraper):
+    parse_targets = ParseTargets(classes=["newsBlock", "market-new-common-collection_contentBox__leEBU"])
+
     def __init__(self):
         super().__init__("LiveMint")
         self.base_url = "https://www.livemint.com/market"
@@ -75,8 +153,11 @@ class LiveMintScraper(BaseScraper):
         
         return stock_market_news
 
-    def scrape_news(self) -> Dict[str, List[str]]:
-        soup = self.fetch_page(self.base_url)
+    def get_page_urls(self) -> List[str]:
+        return [self.base_url]
+
+    def extract_news(self, soups: List[Optional[BeautifulSoup]]) -> Dict[str, List[str]]:
+        soup = soups[0]
         if not soup:
             return {"headlines": [], "stock_news": []}
         
@@ -90,64 +171,46 @@ class LiveMintScraper(BaseScraper):
 
 
 class GoogleFinanceScraper(BaseScraper):
+    parse_targets = ParseTargets(
+        tags=["article"],
+        classes=["JheGif", "ipQwMb", "DY5T1d", "YMlKec", "P6K39c", "ln0Gqe"],
+        attributes=["data-n-tid", "data-symbol"]
+    )
+
     def __init__(self):
         super().__init__("Google Finance")
         self.base_url = "https://www.google.com/finance"
         self.news_url = "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRFZ4ZERBU0FtVnVHZ0pWVXlnQVAB?hl=en-US&gl=US&ceid=US%3Aen"
+        self.news_plan = self.add_selector_plan(
+            "news",
+            ['article h3', 'article h4', '[data-n-tid] h3', '[data-n-tid] h4', '.JheGif', '.ipQwMb', '.DY5T1d'],
+            accept=lambda text: len(text) > 20
+        )
+        self.market_data_plan = self.add_selector_plan(
+            "market_data",
+            ['.YMlKec', '.P6K39c', '[data-symbol]', '.ln0Gqe'],
+            accept=lambda text: any(char.isdigit() for char in text),
+            limit=10
+        )
 
     def extract_google_finance_news(self, soup: BeautifulSoup, limit: int = 15) -> List[str]:
-        headlines = []
-        
-        article_selectors = [
-            'article h3',
-            'article h4', 
-            '[data-n-tid] h3',
-            '[data-n-tid] h4',
-            '.JheGif',
-            '.ipQwMb',
-            '.DY5T1d'
-        ]
-        
-        for selector in article_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                if len(headlines) >= limit:
-                    break
-                text = element.get_text(strip=True)
-                if text and len(text) > 20 and text not in headlines:
-                    headlines.append(text)
-        
-        return headlines[:limit]
+        return self.news_plan.extract(soup, limit)
 
     def extract_market_data(self, soup: BeautifulSoup) -> List[str]:
-        market_data = []
-        
-        price_selectors = [
-            '.YMlKec',
-            '.P6K39c',
-            '[data-symbol]',
-            '.ln0Gqe'
-        ]
-        
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(strip=True)
-                if text and any(char.isdigit() for char in text):
-                    market_data.append(text)
-        
-        return market_data[:10]
+        return self.market_data_plan.extract(soup)
 
-    def scrape_news(self) -> Dict[str, List[str]]:
+    def get_page_urls(self) -> List[str]:
+        return [self.base_url, self.news_url]
+
+    def extract_news(self, soups: List[Optional[BeautifulSoup]]) -> Dict[str, List[str]]:
         headlines = []
         stock_news = []
         
-        soup = self.fetch_page(self.base_url)
+        soup, news_soup = soups
         if soup:
             headlines.extend(self.extract_google_finance_news(soup))
             stock_news.extend(self.extract_market_data(soup))
         
-        news_soup = self.fetch_page(self.news_url)
         if news_soup:
             headlines.extend(self.extract_google_finance_news(news_soup, 10))
         
@@ -158,72 +221,61 @@ class GoogleFinanceScraper(BaseScraper):
 
 
 class YahooFinanceScraper(BaseScraper):
+    parse_targets = ParseTargets(
+        tags=["h3"],
+        classes=["Ov", "js-stream-content", "Fw(600)", "C($c-link)", "Trsdu(0.3s)"],
+        attributes=["data-module", "data-test", "data-symbol"]
+    )
+
     def __init__(self):
         super().__init__("Yahoo Finance")
         self.base_url = "https://finance.yahoo.com"
         self.news_url = "https://finance.yahoo.com/news"
+        self.headline_plan = self.add_selector_plan(
+            "headlines",
+            [
+                'h3[data-test-locator="StreamTitle"]',
+                'h3 a[data-test-locator="StreamTitle"]',
+                '.Ov:nth-of-type(1) h3',
+                '.js-stream-content h3',
+                '[data-module="Stream"] h3',
+                '.Fw(600) a',
+                'h3.Mb\\(5px\\)',
+                '.C\\(\\$c-link\\) h3'
+            ],
+            accept=lambda text: len(text) > 15
+        )
+        self.movers_plan = self.add_selector_plan(
+            "market_movers",
+            [
+                '[data-test="market-summary"] span',
+                '.Trsdu\\(0\\.3s\\)',
+                '[data-symbol] span',
+                '.Fw\\(600\\).C\\(\\$c-trend-up\\)',
+                '.Fw\\(600\\).C\\(\\$c-trend-down\\)'
+            ],
+            accept=lambda text: any(char.isdigit() for char in text) or '%' in text,
+            limit=10
+        )
 
     def extract_yahoo_headlines(self, soup: BeautifulSoup, limit: int = 15) -> List[str]:
-        headlines = []
-        
-        selectors = [
-            'h3[data-test-locator="StreamTitle"]',
-            'h3 a[data-test-locator="StreamTitle"]',
-            '.Ov:nth-of-type(1) h3',
-            '.js-stream-content h3',
-            '[data-module="Stream"] h3',
-            '.Fw(600) a',
-            'h3.Mb\\(5px\\)',
-            '.C\\(\\$c-link\\) h3'
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = soup.select(selector)
-                for element in elements:
-                    if len(headlines) >= limit:
-                        break
-                    text = element.get_text(strip=True)
-                    if text and len(text) > 15 and text not in headlines:
-                        headlines.append(text)
-            except Exception:
-                continue
-        
-        return headlines[:limit]
+        return self.headline_plan.extract(soup, limit)
 
     def extract_market_movers(self, soup: BeautifulSoup) -> List[str]:
-        movers = []
-        
-        selectors = [
-            '[data-test="market-summary"] span',
-            '.Trsdu\\(0\\.3s\\)',
-            '[data-symbol] span',
-            '.Fw\\(600\\).C\\(\\$c-trend-up\\)',
-            '.Fw\\(600\\).C\\(\\$c-trend-down\\)'
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text(strip=True)
-                    if text and (any(char.isdigit() for char in text) or '%' in text):
-                        movers.append(text)
-            except Exception:
-                continue
-        
-        return movers[:10]
+        return self.movers_plan.extract(soup)
 
-    def scrape_news(self) -> Dict[str, List[str]]:
+    def get_page_urls(self) -> List[str]:
+        return [self.base_url, self.news_url]
+
+    def extract_news(self, soups: List[Optional[BeautifulSoup]]) -> Dict[str, List[str]]:
         headlines = []
         stock_news = []
         
-        main_soup = self.fetch_page(self.base_url)
+        main_soup, news_soup = soups
         if main_soup:
             headlines.extend(self.extract_yahoo_headlines(main_soup))
             stock_news.extend(self.extract_market_movers(main_soup))
         
-        news_soup = self.fetch_page(self.news_url)
         if news_soup:
             headlines.extend(self.extract_yahoo_headlines(news_soup, 10))
         
@@ -234,38 +286,32 @@ class YahooFinanceScraper(BaseScraper):
 
 
 class MarketWatchScraper(BaseScraper):
+    parse_targets = ParseTargets(
+        tags=["h2", "h3"],
+        classes=["article__headline", "headline", "WSJTheme--headline-color-black"]
+    )
+
     def __init__(self):
         super().__init__("MarketWatch")
         self.base_url = "https://www.marketwatch.com"
         self.news_url = "https://www.marketwatch.com/latest-news"
+        self.news_plan = self.add_selector_plan(
+            "news",
+            ['.article__headline a', 'h3.article__headline', '.headline a', 'h2 a', 'h3 a',
+             '.WSJTheme--headline-color-black'],
+            accept=lambda text: len(text) > 20
+        )
 
     def extract_marketwatch_news(self, soup: BeautifulSoup, limit: int = 15) -> List[str]:
-        headlines = []
-        
-        selectors = [
-            '.article__headline a',
-            'h3.article__headline',
-            '.headline a',
-            'h2 a',
-            'h3 a',
-            '.WSJTheme--headline-color-black'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                if len(headlines) >= limit:
-                    break
-                text = element.get_text(strip=True)
-                if text and len(text) > 20 and text not in headlines:
-                    headlines.append(text)
-        
-        return headlines[:limit]
+        return self.news_plan.extract(soup, limit)
 
-    def scrape_news(self) -> Dict[str, List[str]]:
+    def get_page_urls(self) -> List[str]:
+        return [self.news_url]
+
+    def extract_news(self, soups: List[Optional[BeautifulSoup]]) -> Dict[str, List[str]]:
         headlines = []
         
-        soup = self.fetch_page(self.news_url)
+        soup = soups[0]
         if soup:
             headlines = self.extract_marketwatch_news(soup)
         
@@ -298,46 +344,189 @@ class ScraperFactory:
         return list(cls._scrapers.keys())
 
 
+class ScrapeSnapshot:
+    def __init__(self, results: Dict[str, Dict], seen_index: Optional[SeenHeadlineIndex] = None):
+        self.results = results
+        self.timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.created_at = time.monotonic()
+        self._combined = None
+        self._new_combined = None
+        self.seen_index = seen_index
+        self.seen_committed = False
+        self.new_news = None
+        if seen_index is not None:
+            self.new_news = {
+                source: {kind: seen_index.filter_new(source, news.get(kind, [])) for kind in ("headlines", "stock_news")}
+                for source, news in self.get_per_source_news().items()
+            }
+
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def is_fresh(self, max_age: float) -> bool:
+        return self.age() <= max_age
+
+    def get_source_news(self, source: str) -> Dict[str, List[str]]:
+        return self.results.get(source, {}).get("data", {"headlines": [], "stock_news": []})
+
+    def get_per_source_news(self) -> Dict[str, Dict[str, List[str]]]:
+        return {source: self.get_source_news(source) for source in self.results}
+
+    def get_metadata(self) -> Dict[str, Dict]:
+        return {
+            source: {key: value for key, value in result.items() if key != "data"}
+            for source, result in self.results.items()
+        }
+
+    def _combine(self, per_source_news: Dict[str, Dict[str, List[str]]]) -> Dict[str, List[str]]:
+        combined_headlines = []
+        combined_stock_news = []
+
+        for source, news in per_source_news.items():
+            combined_headlines.extend(news.get("headlines", []))
+            combined_stock_news.extend(news.get("stock_news", []))
+
+        return {
+            "headlines": list(dict.fromkeys(combined_headlines)),
+            "stock_news": list(dict.fromkeys(combined_stock_news)),
+            "sources": list(self.results.keys()),
+            "total_sources": len(self.results)
+        }
+
+    def get_combined_news(self) -> Dict[str, List[str]]:
+        if self._combined is None:
+            self._combined = self._combine(self.get_per_source_news())
+        return self._combined
+
+    def get_new_source_news(self, source: str) -> Dict[str, List[str]]:
+        if self.new_news is None:
+            return self.get_source_news(source)
+        return self.new_news.get(source, {"headlines": [], "stock_news": []})
+
+    def get_new_news(self) -> Dict[str, List[str]]:
+        if self.new_news is None:
+            return self.get_combined_news()
+        if self._new_combined is None:
+            self._new_combined = self._combine(self.new_news)
+        return self._new_combined
+
+    def commit_seen(self):
+        if self.seen_index is None or self.seen_committed:
+            return
+        for source, news in self.get_per_source_news().items():
+            self.seen_index.mark_seen(source, news.get("headlines", []) + news.get("stock_news", []))
+        self.new_news = {source: {"headlines": [], "stock_news": []} for source in self.results}
+        self._new_combined = None
+        self.seen_committed = True
+
+
 class MultiSourceScraper:
-    def __init__(self, sources: List[str] = None):
+    def __init__(self, sources: List[str] = None, rate_limiter: Optional[HostRateLimiter] = None,
+                 max_age: float = 60.0, http_cache: Optional[HttpCache] = None, parser_backend: Optional[str] = None,
+                 seen_index: Optional[SeenHeadlineIndex] = None):
         if sources is None:
             sources = ["livemint", "google", "yahoo"]
         
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.max_age = max_age
+        self.http_cache = http_cache
+        self.parser_backend = resolve_parser_backend(parser_backend)
+        self.seen_index = seen_index
+        self._snapshot: Optional[ScrapeSnapshot] = None
+        self._snapshot_lock = threading.Lock()
         self.scrapers = {}
         for source in sources:
             try:
                 self.scrapers[source] = ScraperFactory.create_scraper(source)
+                self.scrapers[source].rate_limiter = self.rate_limiter
+                self.scrapers[source].http_cache = self.http_cache
+                self.scrapers[source].parser_backend = self.parser_backend
             except ValueError as e:
                 print(f"Warning: {e}")
 
+    def get_selector_stats(self) -> Dict[str, Dict[str, Dict]]:
+        return {source: scraper.get_selector_stats() for source, scraper in self.scrapers.items()}
+
+    def _scrape_source(self, source_name: str, scraper: BaseScraper) -> Dict:
+        try:
+            print(f"Scraping {source_name}...")
+            return scraper.get_news_with_metadata()
+        except Exception as e:
+            print(f"Error scraping {source_name}: {e}")
+            return {
+                "error": str(e),
+                "data": {"headlines": [], "stock_news": []}
+            }
+
+    def _scrape_sources(self) -> Dict[str, Dict]:
+        if not self.scrapers:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(self.scrapers), thread_name_prefix="scrape") as executor:
+            futures = {
+                source_name: executor.submit(self._scrape_source, source_name, scraper)
+                for source_name, scraper in self.scrapers.items()
+            }
+            return {source_name: future.result() for source_name, future in futures.items()}
+
+    def snapshot(self, max_age: Optional[float] = None, refresh: bool = False) -> ScrapeSnapshot:
+        max_age = self.max_age if max_age is None else max_age
+        with self._snapshot_lock:
+            if refresh or self._snapshot is None or not self._snapshot.is_fresh(max_age):
+                self._snapshot = ScrapeSnapshot(self._scrape_sources(), self.seen_index)
+            return self._snapshot
+
     def scrape_all_sources(self) -> Dict[str, Dict]:
-        results = {}
-        for source_name, scraper in self.scrapers.items():
+        return self.snapshot().results
+
+    async def gather(self, timeout: float = 30.0, request_timeout: float = 15.0, client=None,
+                     parse_workers: int = 4) -> Dict[str, Dict]:
+        from async_scraper import AsyncBaseScraper, AsyncHttpClient
+
+        if not self.scrapers:
+            return {}
+
+        owns_client = client is None
+        if owns_client:
+            headers = dict(next(iter(self.scrapers.values())).session.headers)
+            client = AsyncHttpClient(timeout=request_timeout, headers=headers)
+        executor = ThreadPoolExecutor(max_workers=parse_workers, thread_name_prefix="parse")
+
+        async def scrape(source_name: str, scraper: BaseScraper) -> Dict:
+            print(f"Scraping {source_name}...")
+            async_scraper = AsyncBaseScraper(scraper, client, executor, request_timeout)
             try:
-                print(f"Scraping {source_name}...")
-                results[source_name] = scraper.get_news_with_metadata()
-                time.sleep(1)
+                return await asyncio.wait_for(async_scraper.get_news_with_metadata(), timeout)
+            except asyncio.TimeoutError:
+                print(f"Timed out scraping {source_name} after {timeout}s")
+                error = f"Timed out after {timeout}s"
             except Exception as e:
                 print(f"Error scraping {source_name}: {e}")
-                results[source_name] = {
-                    "error": str(e),
-                    "data": {"headlines": [], "stock_news": []}
-                }
+                error = str(e)
+            return {
+                "error": error,
+                "data": {"headlines": [], "stock_news": []}
+            }
+
+        try:
+            results = await asyncio.gather(*(scrape(name, scraper) for name, scraper in self.scrapers.items()))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            if owns_client:
+                await client.close()
+        results = dict(zip(self.scrapers, results))
+        snapshot = await asyncio.get_running_loop().run_in_executor(None, ScrapeSnapshot, results, self.seen_index)
+        with self._snapshot_lock:
+            self._snapshot = snapshot
         return results
 
     def get_combined_news(self) -> Dict[str, List[str]]:
-        all_results = self.scrape_all_sources()
-        combined_headlines = []
-        combined_stock_news = []
-        
-        for source, data in all_results.items():
-            if "data" in data:
-                combined_headlines.extend(data["data"].get("headlines", []))
-                combined_stock_news.extend(data["data"].get("stock_news", []))
-        
-        return {
-            "headlines": list(set(combined_headlines)),
-            "stock_news": list(set(combined_stock_news)),
-            "sources": list(all_results.keys()),
-            "total_sources": len(all_results)
-        }
+        return self.snapshot().get_combined_news()
+
+    def get_new_news(self) -> Dict[str, List[str]]:
+        return self.snapshot().get_new_news()
+
+    def commit_seen(self):
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+        if snapshot is not None:
+            snapshot.commit_seen()
@@ -26,7 +26,8 @@ def demo_multi_source_analysis():
     console.print(f"📊 [yellow]Active sources: {', '.join([s.title() for s in sources])}[/yellow]\n")
     
     console.print("[bold magenta]📰 Step 1: Scraping from all sources...[/bold magenta]")
-    all_results = multi_scraper.scrape_all_sources()
+    snapshot = multi_scraper.snapshot()
+    all_results = snapshot.results
     
     source_table = Table(title="📊 Source Results Summary", show_header=True, header_style="bold magenta")
     source_table.add_column("Source", style="bold cyan")
@@ -49,7 +50,7 @@ def demo_multi_source_analysis():
     console.print(source_table)
     
     console.print("\n[bold magenta]📈 Step 2: Combining all news sources...[/bold magenta]")
-    combined_data = multi_scraper.get_combined_news()
+    combined_data = snapshot.get_combined_news()
     
     total_headlines = len(combined_data.get("headlines", []))
     total_market_data = len(combined_data.get("stock_news", []))
@@ -0,0 +1,184 @@
+from typing import Dict, Iterator, List, Optional
+import math
+import multiprocessing
+import os
+import time
+from enhanced_sentiment import EnhancedSentimentAnalyzer
+from sentiment_cache import SentimentCache
+from sentiment_batch import SentimentBatch
+
+
+_worker_analyzer = None
+_worker_error = None
+
+
+def _init_worker(model_name: str, batch_size: int, max_length: int, precision: str, backend: str,
+                 threads_per_worker: int, cache_path: Optional[str], lexicon_path: Optional[str]):
+    global _worker_analyzer, _worker_error
+
+    try:
+        cache = SentimentCache(cache_path) if cache_path else None
+        _worker_analyzer = EnhancedSentimentAnalyzer(
+            model_name,
+            batch_size=batch_size,
+            max_length=max_length,
+            cache=cache,
+            precision=precision,
+            backend=backend,
+            num_threads=threads_per_worker,
+            lexicon_path=lexicon_path
+        )
+    except Exception as e:
+        _worker_error = e
+
+
+def _check_worker():
+    if _worker_error is not None:
+        raise RuntimeError(f"Sentiment worker {os.getpid()} failed to load the model: {_worker_error}")
+
+
+def _analyze_shard(shard: Dict) -> SentimentBatch:
+    _check_worker()
+    return _worker_analyzer.analyze_columnar(shard["texts"], shard["sources"])
+
+
+def _worker_ready(_) -> int:
+    _check_worker()
+    time.sleep(0.1)
+    return os.getpid()
+
+
+class ParallelSentimentAnalyzer(EnhancedSentimentAnalyzer):
+    def __init__(self, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment", num_workers: Optional[int] = None,
+                 threads_per_worker: Optional[int] = None, batch_size: int = 32, max_length: int = 512,
+                 precision: str = "fp32", backend: str = "torch", cache_path: Optional[str] = None,
+                 shards_per_worker: int = 4, lexicon_path: Optional[str] = None):
+        cpu_count = os.cpu_count() or 1
+        self.num_workers = num_workers or cpu_count
+        self.threads_per_worker = threads_per_worker or max(1, cpu_count // self.num_workers)
+        self.shards_per_worker = shards_per_worker
+
+        self._configure(model_name, batch_size=batch_size, max_length=max_length, precision=precision,
+                        backend=backend, num_threads=self.threads_per_worker, lexicon_path=lexicon_path)
+        self.cache_path = cache_path
+
+        context = multiprocessing.get_context("spawn")
+        self.pool = context.Pool(
+            processes=self.num_workers,
+            initializer=_init_worker,
+            initargs=(model_name, batch_size, max_length, self.precision, backend, self.threads_per_worker, cache_path,
+                      lexicon_path)
+        )
+
+    def is_ready(self) -> bool:
+        return self.pool is not None
+
+    def wait_until_ready(self, timeout: float = 300.0):
+        ready_workers = set()
+        deadline = time.monotonic() + timeout
+        while len(ready_workers) < self.num_workers:
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                pids = self.pool.map_async(_worker_ready, range(self.num_workers * 2), chunksize=1).get(remaining)
+            except multiprocessing.TimeoutError:
+                raise TimeoutError(
+                    f"Only {len(ready_workers)} of {self.num_workers} sentiment workers were ready after {timeout}s"
+                )
+            ready_workers.update(pids)
+
+    def analyze_columnar(self, texts: List[str], sources: List[str] = None, batch_size: Optional[int] = None) -> SentimentBatch:
+        if sources is None:
+            sources = [None] * len(texts)
+        if not texts:
+            return SentimentBatch.empty(texts, sources, enhanced=True)
+        return SentimentBatch.concat(list(self.pool.imap(_analyze_shard, self._shards(texts, sources))))
+
+    def _stream_columnar(self, texts: List[str], sources: List[str], batch_size: Optional[int] = None) -> Iterator[SentimentBatch]:
+        if texts:
+            yield from self.pool.imap(_analyze_shard, self._shards(texts, sources))
+
+    def _shards(self, texts: List[str], sources: List[str]) -> List[Dict]:
+        shard_count = min(len(texts), self.num_workers * self.shards_per_worker)
+        shard_size = math.ceil(len(texts) / shard_count)
+        return [
+            {"texts": texts[start:start + shard_size], "sources": sources[start:start + shard_size]}
+            for start in range(0, len(texts), shard_size)
+        ]
+
+    def get_padding_stats(self) -> Dict[str, float]:
+        return {}
+
+    def get_pipeline_stats(self) -> Dict[str, float]:
+        return {}
+
+    def get_dedup_stats(self) -> Dict[str, float]:
+        return {}
+
+    def get_cascade_stats(self) -> Dict[str, float]:
+        return {}
+
+    def close(self):
+        pool = getattr(self, "pool", None)
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+            self.pool = None
+
+
+def measure_scaling(texts: List[str], worker_counts: List[int], model_name: str = "cardiffnlp/twitter-roberta-base-sentiment",
+                    threads_per_worker: Optional[int] = None, **analyzer_kwargs) -> Dict[int, Dict[str, float]]:
+    threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // max(worker_counts))
+    report = {}
+    baseline_throughput = None
+
+    for workers in worker_counts:
+        analyzer = ParallelSentimentAnalyzer(
+            model_name,
+            num_workers=workers,
+            threads_per_worker=threads_per_worker,
+            **analyzer_kwargs
+        )
+        try:
+            analyzer.wait_until_ready()
+
+            start = time.perf_counter()
+            analyzer.analyze_batch(texts)
+            seconds = time.perf_counter() - start
+        finally:
+            analyzer.close()
+
+        throughput = len(texts) / seconds if seconds > 0 else 0.0
+        if baseline_throughput is None:
+            baseline_throughput = throughput / worker_counts[0]
+
+        speedup = throughput / baseline_throughput if baseline_throughput else 0.0
+        report[workers] = {
+            "threads_per_worker": threads_per_worker,
+            "seconds": seconds,
+            "items_per_second": throughput,
+            "speedup": speedup,
+            "scaling_efficiency": speedup / workers
+        }
+
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    from precision_check import AGREEMENT_CORPUS
+
+    parser = argparse.ArgumentParser(description="Measure ParallelSentimentAnalyzer scaling per worker count")
+    parser.add_argument("--model", default="cardiffnlp/twitter-roberta-base-sentiment")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--threads-per-worker", type=int, default=None,
+                        help="Threads per worker, held fixed across worker counts (default: cores / max workers)")
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--precision", default="fp32")
+    args = parser.parse_args()
+
+    corpus = (AGREEMENT_CORPUS * math.ceil(args.items / len(AGREEMENT_CORPUS)))[:args.items]
+    scaling = measure_scaling(corpus, args.workers, args.model, threads_per_worker=args.threads_per_worker,
+                              backend=args.backend, precision=args.precision)
+    print(json.dumps(scaling, indent=2))
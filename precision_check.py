@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import time
+from typing import Dict, List
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+from enhanced_sentiment import EnhancedSentimentAnalyzer
+from model_registry import SUPPORTED_PRECISIONS
+from inference_backends import BackendFactory
+
+
+AGREEMENT_CORPUS = [
+    "Sensex surges 800 points as banking stocks rally",
+    "Stocks plunge on recession fears and weak earnings",
+    "Markets steady ahead of Federal Reserve decision",
+    "Gold price today: Rates hit a new high on global market uncertainty",
+    "Reliance Q2 results preview: Revenue, profit may rise on strong petrochemical performance",
+    "Eternal share price: Will Friday bring a rebound or further decline?",
+    "Infosys ADR shares crash 4% on NYSE after Q2 results disappoint investors",
+    "Nifty ends flat as investors await inflation data",
+    "Oil prices slump as OPEC output concerns ease",
+    "Tesla beats delivery estimates, shares climb in premarket trading",
+    "Bank of England holds rates unchanged, signals cautious outlook",
+    "Tech stocks drag Nasdaq lower as bond yields jump",
+    "Rupee weakens past 84 per dollar amid foreign outflows",
+    "HDFC Bank posts robust quarterly profit growth, beats estimates",
+    "Crypto market loses $200 billion in a day as bitcoin tumbles",
+    "Dow closes at record high on strong jobs report",
+    "Analysts downgrade Boeing on mounting delivery delays",
+    "Asian markets mixed as China data disappoints",
+    "Fed officials see no rush to cut rates further",
+    "Small-cap index rallies 3% as retail investors pile in",
+    "Adani group stocks fall after fresh regulatory scrutiny",
+    "Apple unveils new iPhone lineup; shares little changed",
+    "Wall Street slides as investors worry about tariffs",
+    "TCS wins multi-year deal worth $1 billion from UK insurer",
+    "Euro zone inflation eases more than expected in September",
+    "Zomato shares soar 10% after upbeat earnings guidance",
+    "Treasury yields steady ahead of CPI release",
+    "Airline stocks retreat as jet fuel prices climb",
+    "SEBI tightens rules for futures and options trading",
+    "IPO market sees record fundraising in the first half",
+    "Pharma stocks decline on US pricing pressure",
+    "Amazon to invest $10 billion in new data centres",
+    "Copper hits two-week low on weak Chinese demand",
+    "Startups face funding winter as investors turn pessimistic",
+    "Auto sales rise 12% in festive season boost",
+    "Global markets brace for volatile week ahead",
+    "Microsoft earnings miss on cloud slowdown, stock drops",
+    "FII buying lifts Indian equities for third straight session",
+    "Housing starts decline for second month as mortgage rates rise",
+    "ITC hits 52-week high on hotel demerger optimism",
+]
+
+
+def run_agreement_check(model_name: str, precisions: List[str], texts: List[str] = None,
+                        backend: str = "torch") -> Dict[str, Dict]:
+    texts = texts or AGREEMENT_CORPUS
+    report = {}
+
+    baseline = EnhancedSentimentAnalyzer(model_name, precision="fp32", backend=backend)
+    start = time.perf_counter()
+    baseline_batch = baseline.analyze_columnar(texts)
+    baseline_seconds = time.perf_counter() - start
+
+    for precision in precisions:
+        if precision == "fp32":
+            analyzer, batch, seconds = baseline, baseline_batch, baseline_seconds
+        else:
+            try:
+                analyzer = EnhancedSentimentAnalyzer(model_name, precision=precision, backend=backend)
+            except ValueError as e:
+                report[precision] = {"skipped": str(e)}
+                continue
+            if analyzer.precision != precision:
+                report[precision] = {"skipped": f"fell back to {analyzer.precision}"}
+                analyzer.close()
+                continue
+            start = time.perf_counter()
+            batch = analyzer.analyze_columnar(texts)
+            seconds = time.perf_counter() - start
+
+        model_scored = baseline_batch.has_raw_scores & batch.has_raw_scores
+        if not model_scored.any():
+            report[precision] = {"skipped": "no texts were scored by the model"}
+        else:
+            raw = batch.raw_scores[model_scored]
+            baseline_raw = baseline_batch.raw_scores[model_scored]
+            drift = np.abs(raw - baseline_raw)
+            report[precision] = {
+                "texts": len(texts),
+                "model_scored": int(model_scored.sum()),
+                "raw_label_agreement": float(np.mean(raw.argmax(axis=1) == baseline_raw.argmax(axis=1))),
+                "blended_label_agreement": float(np.mean(batch.label_ids == baseline_batch.label_ids)),
+                "mean_score_drift": float(drift.mean()),
+                "max_score_drift": float(drift.max()),
+                "seconds": seconds,
+                "speedup_vs_fp32": baseline_seconds / seconds if seconds > 0 else 0.0
+            }
+
+        if analyzer is not baseline:
+            analyzer.close()
+
+    baseline.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare reduced-precision inference against fp32")
+    parser.add_argument("--model", default="cardiffnlp/twitter-roberta-base-sentiment")
+    parser.add_argument("--precisions", nargs="+", default=SUPPORTED_PRECISIONS, choices=SUPPORTED_PRECISIONS)
+    parser.add_argument("--backend", default="torch", choices=BackendFactory.get_available_backends())
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run_agreement_check(args.model, args.precisions, backend=args.backend)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    console = Console()
+    table = Table(title="🎯 Precision Agreement vs fp32", show_header=True, header_style="bold magenta")
+    table.add_column("Precision", style="bold cyan")
+    table.add_column("Raw Agreement", style="green")
+    table.add_column("Blended Agreement", style="green")
+    table.add_column("Mean Drift", style="yellow")
+    table.add_column("Max Drift", style="yellow")
+    table.add_column("Speedup", style="bold")
+
+    for precision, stats in report.items():
+        if "skipped" in stats:
+            table.add_row(precision, f"[dim]{stats['skipped']}[/dim]", "", "", "", "")
+            continue
+        table.add_row(
+            precision,
+            f"{stats['raw_label_agreement']*100:.1f}%",
+            f"{stats['blended_label_agreement']*100:.1f}%",
+            f"{stats['mean_score_drift']:.4f}",
+            f"{stats['max_score_drift']:.4f}",
+            f"{stats['speedup_vs_fp32']:.2f}x"
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,33 +12,31 @@ def quick_test():
     available_sources = ScraperFactory.get_available_sources()
     print(f"Available sources: {', '.join(available_sources)}")
     
-    print("\n2. Testing Google Finance scraper...")
+    print("\n2. Scraping LiveMint, Google Finance and Yahoo Finance once...")
     try:
-        google_scraper = ScraperFactory.create_scraper("google")
-        google_data = google_scraper.scrape_news()
-        print(f"✅ Google Finance: {len(google_data['headlines'])} headlines, {len(google_data['stock_news'])} market updates")
+        multi_scraper = MultiSourceScraper(["livemint", "google", "yahoo"])
+        snapshot = multi_scraper.snapshot()
+        metadata = snapshot.get_metadata()
     except Exception as e:
-        print(f"❌ Google Finance error: {e}")
-    
-    print("\n3. Testing Yahoo Finance scraper...")
-    try:
-        yahoo_scraper = ScraperFactory.create_scraper("yahoo")
-        yahoo_data = yahoo_scraper.scrape_news()
-        print(f"✅ Yahoo Finance: {len(yahoo_data['headlines'])} headlines, {len(yahoo_data['stock_news'])} market updates")
-    except Exception as e:
-        print(f"❌ Yahoo Finance error: {e}")
-    
-    print("\n4. Testing multi-source combination...")
-    try:
-        multi_scraper = MultiSourceScraper(["livemint", "google"])
-        combined_data = multi_scraper.get_combined_news()
+        print(f"❌ Scraping error: {e}")
+        snapshot = None
+
+    if snapshot:
+        print("\n3. Testing individual sources...")
+        for source, label in [("google", "Google Finance"), ("yahoo", "Yahoo Finance")]:
+            if "error" in metadata.get(source, {}):
+                print(f"❌ {label} error: {metadata[source]['error']}")
+                continue
+            source_data = snapshot.get_source_news(source)
+            print(f"✅ {label}: {len(source_data['headlines'])} headlines, {len(source_data['stock_news'])} market updates")
+
+        print("\n4. Testing multi-source combination...")
+        combined_data = snapshot.get_combined_news()
         total_articles = len(combined_data['headlines']) + len(combined_data['stock_news'])
         print(f"✅ Combined data: {total_articles} total articles from {len(combined_data.get('sources', []))} sources")
         
         if combined_data['headlines']:
             print(f"📰 Sample headline: {combined_data['headlines'][0][:100]}...")
-    except Exception as e:
-        print(f"❌ Multi-source error: {e}")
     
     print("\n5. Testing enhanced sentiment analysis...")
     try:
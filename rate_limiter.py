@@ -0,0 +1,67 @@
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate: float = 1.0, capacity: float = 2.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    def __init__(self, rate: float = 1.0, capacity: float = 2.0, host_overrides: Optional[Dict[str, tuple]] = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.host_overrides = host_overrides or {}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.wait_seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self.buckets:
+                rate, capacity = self.host_overrides.get(host, (self.rate, self.capacity))
+                self.buckets[host] = TokenBucket(rate, capacity)
+                self.wait_seconds[host] = 0.0
+            return self.buckets[host]
+
+    def reserve(self, url: str) -> float:
+        host = urlparse(url).netloc.lower()
+        delay = self._bucket(host).reserve()
+        with self._lock:
+            self.wait_seconds[host] += delay
+        return delay
+
+    def acquire(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self.wait_seconds)
+
+
+DEFAULT_RATE_LIMITER = HostRateLimiter()
@@ -1,29 +1,56 @@
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
+import sys
 import time
+import html_parsing
+from http_cache import HttpCache, code_digest
+from html_parsing import ParseTargets, parse_html, resolve_parser_backend
 
 
 class Newscraper:
-    def __init__(self, base_url: str = "https://www.livemint.com/market"):
+    parse_targets = ParseTargets(classes=["newsBlock", "market-new-common-collection_contentBox__leEBU"])
+
+    def __init__(self, base_url: str = "https://www.livemint.com/market", http_cache: Optional[HttpCache] = None,
+                 parser_backend: Optional[str] = None):
         self.base_url = base_url
+        self.http_cache = http_cache
+        self.parser_backend = resolve_parser_backend(parser_backend)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_content(self, url: str) -> Optional[bytes]:
+        headers = {}
+        if self.http_cache:
+            cached, headers = self.http_cache.conditional_request(self.base_url, url)
+            if cached is not None:
+                return cached
+
         try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                return BeautifulSoup(response.content, "html.parser")
-            else:
-                print(f"Failed to retrieve webpage: {response.status_code}")
-                return None
+            response = self.session.get(url, timeout=10, headers=headers)
         except requests.RequestException as e:
             print(f"Error fetching page: {e}")
             return None
 
+        if self.http_cache:
+            content = self.http_cache.resolve_response(self.base_url, url, response.status_code,
+                                                       response.headers, response.content)
+        else:
+            content = response.content if response.status_code == 200 else None
+        if content is None:
+            print(f"Failed to retrieve webpage: {response.status_code}")
+        return content
+
+    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        content = self.fetch_content(url)
+        return parse_html(content, self.parser_backend, self.parse_targets) if content is not None else None
+
+    def extractor_version(self) -> Optional[str]:
+        code = code_digest(sys.modules[__name__], html_parsing)
+        return f"{type(self).__name__}:{self.parser_backend}:{code}" if code else None
+
     def extract_market_headlines(self, soup: BeautifulSoup) -> List[str]:
         headlines = []
         news_blocks = soup.find_all("li", class_="newsBlock")
@@ -53,17 +80,27 @@ class Newscraper:
         return stock_market_news
 
     def scrape_news(self) -> Dict[str, List[str]]:
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        content = self.fetch_content(self.base_url)
+        if content is None:
             return {"headlines": [], "stock_news": []}
-        
+
+        signature = HttpCache.content_signature([content], self.extractor_version()) if self.http_cache else None
+        if signature:
+            cached = self.http_cache.get_extracted(self.base_url, signature)
+            if cached is not None:
+                return cached
+
+        soup = parse_html(content, self.parser_backend, self.parse_targets)
         headlines = self.extract_market_headlines(soup)
         stock_news = self.extract_stock_market_news(soup)
         
-        return {
+        news = {
             "headlines": headlines,
             "stock_news": stock_news
         }
+        if signature:
+            self.http_cache.put_extracted(self.base_url, signature, news)
+        return news
 
     def get_news_with_metadata(self) -> Dict[str, any]:
         news_data = self.scrape_news()
@@ -0,0 +1,211 @@
+from typing import Dict, Iterable, List, Optional, Set
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+from headline_dedup import normalize_headline
+
+
+DEFAULT_SEEN_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".cache", "twsm", "seen_headlines.sqlite")
+
+
+class BloomFilter:
+    def __init__(self, num_bits: int = 1 << 20, num_hashes: int = 7):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = np.zeros((num_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, key: str) -> np.ndarray:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return np.array([(first + i * second) % self.num_bits for i in range(self.num_hashes)], dtype=np.int64)
+
+    def add(self, key: str):
+        positions = self._positions(key)
+        np.bitwise_or.at(self.bits, positions >> 3, (1 << (positions & 7)).astype(np.uint8))
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        positions = self._positions(key)
+        return bool(np.all(self.bits[positions >> 3] & (1 << (positions & 7)).astype(np.uint8)))
+
+    def false_positive_rate(self) -> float:
+        return float((1 - np.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes)
+
+
+class SeenHeadlineIndex:
+    def __init__(self, db_path: Optional[str] = DEFAULT_SEEN_INDEX_PATH, ttl_seconds: float = 2 * 24 * 3600,
+                 max_entries: int = 100000, bloom_bits: int = 1 << 20, bloom_hashes: int = 7):
+        self.db_path = db_path or ":memory:"
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bloom = BloomFilter(bloom_bits, bloom_hashes)
+        self.lock = threading.Lock()
+        self.connection = None
+        self.stats = {"observed": 0, "new": 0, "bloom_negatives": 0, "bloom_false_positives": 0, "expired": 0}
+        self._open()
+
+    @staticmethod
+    def make_key(source: str, text: str) -> str:
+        return f"{source}|{normalize_headline(text)}"
+
+    def _open(self):
+        try:
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        except sqlite3.Error as e:
+            print(f"Warning: seen-headline index kept in memory only ({e})")
+            self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_headlines (key TEXT PRIMARY KEY, source TEXT, last_seen REAL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_seen_headlines_last_seen ON seen_headlines (last_seen)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_bloom (id INTEGER PRIMARY KEY, num_bits INTEGER, num_hashes INTEGER, "
+            "count INTEGER, bits BLOB)"
+        )
+        self.connection.commit()
+
+        row = self.connection.execute("SELECT num_bits, num_hashes, count, bits FROM seen_bloom WHERE id = 1").fetchone()
+        if row and row[0] == self.bloom.num_bits and row[1] == self.bloom.num_hashes:
+            self.bloom.count = row[2]
+            self.bloom.bits = np.frombuffer(row[3], dtype=np.uint8).copy()
+            self.prune()
+        else:
+            self.prune(rebuild=True)
+
+    def _rebuild_bloom(self):
+        self.bloom = BloomFilter(self.bloom.num_bits, self.bloom.num_hashes)
+        for (key,) in self.connection.execute("SELECT key FROM seen_headlines"):
+            self.bloom.add(key)
+
+    def _save_bloom(self):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO seen_bloom (id, num_bits, num_hashes, count, bits) VALUES (1, ?, ?, ?, ?)",
+            (self.bloom.num_bits, self.bloom.num_hashes, self.bloom.count, self.bloom.bits.tobytes())
+        )
+
+    def _last_seen(self, keys: List[str]) -> Dict[str, float]:
+        found = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self.connection.execute(
+                f"SELECT key, last_seen FROM seen_headlines WHERE key IN ({placeholders})", chunk
+            ).fetchall())
+        return found
+
+    def _find_new(self, keys: List[str], now: float) -> Set[str]:
+        unique_keys = list(dict.fromkeys(keys))
+        maybe_seen = [key for key in unique_keys if key in self.bloom]
+        self.stats["bloom_negatives"] += len(unique_keys) - len(maybe_seen)
+
+        last_seen = self._last_seen(maybe_seen)
+        new_keys = set()
+        for key in unique_keys:
+            if key not in last_seen:
+                new_keys.add(key)
+                if key in maybe_seen:
+                    self.stats["bloom_false_positives"] += 1
+            elif now - last_seen[key] > self.ttl_seconds:
+                new_keys.add(key)
+                self.stats["expired"] += 1
+        return new_keys
+
+    def filter_new(self, source: str, texts: Iterable[str]) -> List[str]:
+        texts = list(texts)
+        keys = [self.make_key(source, text) for text in texts]
+
+        with self.lock:
+            self.stats["observed"] += len(texts)
+            try:
+                new_keys = self._find_new(keys, time.time())
+            except sqlite3.Error as e:
+                print(f"Warning: seen-headline index error: {e}")
+                return texts
+
+            new_texts = []
+            for text, key in zip(texts, keys):
+                if key in new_keys:
+                    new_texts.append(text)
+                    new_keys.discard(key)
+            self.stats["new"] += len(new_texts)
+        return new_texts
+
+    def mark_seen(self, source: str, texts: Iterable[str]):
+        now = time.time()
+        keys = list(dict.fromkeys(self.make_key(source, text) for text in texts))
+
+        with self.lock:
+            try:
+                added = [key for key in keys if key not in self.bloom]
+                for key in added:
+                    self.bloom.add(key)
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO seen_headlines (key, source, last_seen) VALUES (?, ?, ?)",
+                    [(key, source, now) for key in keys]
+                )
+                if added:
+                    self._save_bloom()
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: seen-headline index error: {e}")
+                return
+
+        if self.bloom.count > self.max_entries:
+            self.prune()
+
+    def observe(self, source: str, texts: Iterable[str]) -> List[str]:
+        texts = list(texts)
+        new_texts = self.filter_new(source, texts)
+        self.mark_seen(source, texts)
+        return new_texts
+
+    def prune(self, rebuild: bool = False):
+        cutoff = time.time() - self.ttl_seconds
+        with self.lock:
+            try:
+                removed = self.connection.execute("DELETE FROM seen_headlines WHERE last_seen < ?", (cutoff,)).rowcount
+                removed += self.connection.execute(
+                    "DELETE FROM seen_headlines WHERE key NOT IN "
+                    "(SELECT key FROM seen_headlines ORDER BY last_seen DESC LIMIT ?)", (self.max_entries,)
+                ).rowcount
+                if rebuild or removed > 0 or self.bloom.count > self.max_entries:
+                    self._rebuild_bloom()
+                    self._save_bloom()
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: seen-headline index error: {e}")
+
+    def clear(self):
+        with self.lock:
+            try:
+                self.connection.execute("DELETE FROM seen_headlines")
+                self._rebuild_bloom()
+                self._save_bloom()
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: seen-headline index error: {e}")
+
+    def get_stats(self) -> Dict[str, float]:
+        with self.lock:
+            entries = self.connection.execute("SELECT COUNT(*) FROM seen_headlines").fetchone()[0]
+            return {
+                **self.stats,
+                "new_ratio": self.stats["new"] / self.stats["observed"] if self.stats["observed"] else 0.0,
+                "entries": entries,
+                "bloom_false_positive_rate": self.bloom.false_positive_rate()
+            }
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
+            self.connection = None
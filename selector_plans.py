@@ -0,0 +1,113 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import threading
+from bs4 import BeautifulSoup, Tag
+import soupsieve
+
+
+class SelectorPlan:
+    def __init__(self, name: str, selectors: List[str], accept: Optional[Callable[[str], bool]] = None,
+                 limit: Optional[int] = None, prune_after: Optional[int] = 50):
+        self.name = name
+        self.accept = accept
+        self.limit = limit
+        self.prune_after = prune_after
+        self.selectors = []
+        self.invalid = []
+        self.compiled = {}
+        for selector in selectors:
+            try:
+                self.compiled[selector] = soupsieve.compile(selector)
+                self.selectors.append(selector)
+            except soupsieve.SelectorSyntaxError:
+                self.invalid.append(selector)
+
+        self.matches = {selector: 0 for selector in self.selectors}
+        self.full_walks = {selector: 0 for selector in self.selectors}
+        self.pruned = set()
+        self.runs = 0
+        self._lock = threading.Lock()
+
+    def extract(self, soup: BeautifulSoup, limit: Optional[int] = None) -> List[str]:
+        limit = limit if limit is not None else self.limit
+        with self._lock:
+            selectors = [selector for selector in self.selectors if selector not in self.pruned]
+            pruned = len(selectors) < len(self.selectors)
+        if not self.selectors or limit == 0:
+            return []
+
+        buckets, exhausted = self._walk(soup, selectors, limit) if selectors else ([], True)
+        if pruned and self._short(buckets, limit):
+            selectors = list(self.selectors)
+            buckets, exhausted = self._walk(soup, selectors, limit)
+        self._record(selectors, buckets, exhausted)
+
+        results = []
+        merged = set()
+        for bucket in buckets:
+            for text in bucket:
+                if text not in merged:
+                    merged.add(text)
+                    results.append(text)
+        return results[:limit] if limit is not None else results
+
+    @staticmethod
+    def _short(buckets: List[List[str]], limit: Optional[int]) -> bool:
+        if limit is None:
+            return not any(buckets)
+        return len(set().union(*buckets)) < limit
+
+    def _walk(self, soup: BeautifulSoup, selectors: List[str],
+              limit: Optional[int]) -> Tuple[List[List[str]], bool]:
+        compiled = [self.compiled[selector] for selector in selectors]
+        buckets = [[] for _ in selectors]
+        seen = [set() for _ in selectors]
+        open_indexes = list(range(len(selectors)))
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            text = None
+            filled = False
+            for index in open_indexes:
+                if not compiled[index].match(element):
+                    continue
+                if text is None:
+                    text = element.get_text(strip=True)
+                if not text or text in seen[index] or (self.accept and not self.accept(text)):
+                    continue
+                seen[index].add(text)
+                buckets[index].append(text)
+                filled = filled or (limit is not None and len(buckets[index]) >= limit)
+
+            if filled:
+                open_indexes = [index for index in open_indexes if len(buckets[index]) < limit]
+                if not open_indexes or len(buckets[0]) >= limit:
+                    return buckets, False
+
+        return buckets, True
+
+    def _record(self, selectors: List[str], buckets: List[List[str]], exhausted: bool):
+        with self._lock:
+            self.runs += 1
+            for selector, bucket in zip(selectors, buckets):
+                self.matches[selector] += len(bucket)
+                if bucket:
+                    self.pruned.discard(selector)
+                elif exhausted:
+                    self.full_walks[selector] += 1
+
+            if self.prune_after is not None:
+                self.pruned.update(
+                    selector for selector in self.selectors
+                    if self.matches[selector] == 0 and self.full_walks[selector] >= self.prune_after
+                )
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "matches": dict(self.matches),
+                "invalid": list(self.invalid),
+                "dead": [selector for selector in self.selectors if self.runs and self.matches[selector] == 0],
+                "pruned": [selector for selector in self.selectors if selector in self.pruned]
+            }
@@ -1,26 +1,93 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from scipy.special import softmax
-import torch
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import re
+import numpy as np
+from batching import STREAM_CHUNK_BATCHES, LengthBucketScheduler, pad_token_ids
+from sentiment_cache import SentimentCache
+from sentiment_batch import RunningSentimentSummary, SentimentBatch
+from headline_dedup import create_deduplicator
+from market_data import market_data_scores, parse_market_batch
+from model_registry import ModelRegistry, resolve_precision
 
 
 class SentimentAnalyzer:
-    def __init__(self, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment"):
+    def __init__(self, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment", batch_size: int = 32, max_length: int = 512,
+                 cache: Optional[SentimentCache] = None, background_load: bool = False, device: str = "cpu",
+                 precision: str = "fp32", backend: str = "torch", num_threads: Optional[int] = None,
+                 dedup_threshold: Optional[float] = None):
         self.model_name = model_name
-        self.model = None
+        self.device = device
+        self.precision = resolve_precision(precision, device)
+        self.backend_name = backend
+        self.num_threads = num_threads
+        self.cache_model_id = f"{model_name}:{backend}:{self.precision}"
+        self.backend = None
         self.tokenizer = None
         self.labels = ['Negative', 'Neutral', 'Positive']
-        self._load_model()
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.scheduler = LengthBucketScheduler(batch_size, max_length)
+        self.cache = cache
+        self.model_revision = None
+        self.stream_summary = RunningSentimentSummary()
+        self.deduplicator = create_deduplicator(dedup_threshold)
+        self._load_future = None
+        if background_load:
+            self._start_background_load()
+        else:
+            self._load_model()
 
     def _load_model(self):
         try:
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self.backend = ModelRegistry.acquire(
+                self.model_name, self.device, self.precision, self.backend_name, self.num_threads
+            )
         except Exception as e:
             print(f"Error loading model: {e}")
             raise
 
+        self.tokenizer = self.backend.tokenizer
+        self.model_revision = self.backend.revision
+        if self.cache:
+            self.cache.register_model(self.cache_model_id, self.model_revision)
+        self._warm_up()
+
+    def _warm_up(self):
+        input_ids = self.tokenizer(["Markets open steady"], truncation=True, max_length=self.max_length)["input_ids"]
+        self._score_batch(input_ids, len(input_ids[0]))
+
+    def _start_background_load(self):
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment-model-load")
+        self._load_future = executor.submit(self._load_model)
+        executor.shutdown(wait=False)
+
+    def close(self):
+        if self._load_future is not None and not self._load_future.done():
+            self._load_future.add_done_callback(lambda _: self._release_model())
+            return
+        self._release_model()
+
+    def _release_model(self):
+        if self.backend is not None:
+            ModelRegistry.release(self.model_name, self.device, self.precision, self.backend_name, self.num_threads)
+            self.backend = None
+            self.tokenizer = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def is_ready(self) -> bool:
+        return self._load_future is None or self._load_future.done()
+
+    def wait_until_ready(self):
+        if self._load_future is not None:
+            self._load_future.result()
+
     def preprocess_text(self, text: str) -> str:
         words = []
         for word in text.split(' '):
@@ -32,74 +99,178 @@ class SentimentAnalyzer:
         return " ".join(words)
 
     def analyze_sentiment(self, text: str) -> Dict[str, any]:
-        if not text.strip():
-            return {
-                "text": text,
-                "sentiment": "Neutral",
-                "confidence": 0.0,
-                "scores": {"Negative": 0.33, "Neutral": 0.34, "Positive": 0.33}
-            }
-
-        processed_text = self.preprocess_text(text)
-        
+        return self.analyze_batch([text])[0]
+
+    def _score_batch(self, input_ids: List[List[int]], padded_length: int) -> np.ndarray:
+        ids, attention_mask = pad_token_ids(input_ids, padded_length, self.tokenizer.pad_token_id)
+        logits = self.backend.predict(ids, attention_mask)
+        return softmax(logits, axis=1).astype(np.float64)
+
+    def _tokenize(self, texts: List[str]) -> List[Optional[List[int]]]:
         try:
-            encoded_text = self.tokenizer(processed_text, return_tensors='pt', truncation=True, max_length=512)
-            
-            with torch.no_grad():
-                output = self.model(**encoded_text)
-            
-            scores = output.logits[0].detach().numpy()
-            scores = softmax(scores)
-            
-            max_score_index = scores.argmax()
-            sentiment_label = self.labels[max_score_index]
-            confidence = float(scores[max_score_index])
-            
-            score_dict = {label: float(score) for label, score in zip(self.labels, scores)}
-            
-            return {
-                "text": text,
-                "sentiment": sentiment_label,
-                "confidence": confidence,
-                "scores": score_dict
-            }
+            return self.tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
         except Exception as e:
-            print(f"Error analyzing sentiment: {e}")
-            return {
-                "text": text,
-                "sentiment": "Error",
-                "confidence": 0.0,
-                "scores": {"Negative": 0.0, "Neutral": 0.0, "Positive": 0.0}
-            }
-
-    def analyze_batch(self, texts: List[str]) -> List[Dict[str, any]]:
-        results = []
-        for text in texts:
-            result = self.analyze_sentiment(text)
-            results.append(result)
-        return results
+            if len(texts) == 1:
+                print(f"Error analyzing sentiment: {e}")
+                return [None]
+        return [self._tokenize([text])[0] for text in texts]
+
+    def _score_rows(self, input_ids: List[List[int]], padded_length: int) -> Tuple[np.ndarray, List[int]]:
+        try:
+            return self._score_batch(input_ids, padded_length), list(range(len(input_ids)))
+        except Exception as e:
+            if len(input_ids) == 1:
+                print(f"Error analyzing sentiment: {e}")
+                return np.empty((0, len(self.labels))), []
+
+        rows = []
+        scored = []
+        for position, ids in enumerate(input_ids):
+            row_scores, row_scored = self._score_rows([ids], min(len(ids), padded_length))
+            if row_scored:
+                rows.append(row_scores[0])
+                scored.append(position)
+        return (np.stack(rows) if rows else np.empty((0, len(self.labels)))), scored
+
+    def _fill_scores(self, batch: SentimentBatch, batch_indices: List[int], scores: np.ndarray):
+        max_score_indices = scores.argmax(axis=1)
+        batch.scores[batch_indices] = scores
+        batch.label_ids[batch_indices] = max_score_indices
+        batch.confidence[batch_indices] = scores[np.arange(len(batch_indices)), max_score_indices]
+
+    def _cluster(self, texts: List[str]) -> Tuple[List[int], np.ndarray]:
+        if self.deduplicator is None or len(texts) < 2:
+            return list(range(len(texts))), np.arange(len(texts))
+        return self.deduplicator.cluster(texts)
+
+    def analyze_columnar(self, texts: List[str], batch_size: Optional[int] = None) -> SentimentBatch:
+        representatives, labels = self._cluster(texts)
+        if len(representatives) == len(texts):
+            return self._analyze_columnar(texts, batch_size)
+
+        batch = self._analyze_columnar([texts[i] for i in representatives], batch_size).take(labels)
+        batch.texts = list(texts)
+        return batch
+
+    def _analyze_columnar(self, texts: List[str], batch_size: Optional[int] = None) -> SentimentBatch:
+        batch = SentimentBatch.empty(texts)
+        for _ in self._fill_columnar(batch, batch_size):
+            pass
+        return batch
+
+    def _fill_columnar(self, batch: SentimentBatch, batch_size: Optional[int] = None) -> Iterator[List[int]]:
+        texts = batch.texts
+        pending = []
+        blank = []
+
+        for i, text in enumerate(texts):
+            if text.strip():
+                pending.append(i)
+            else:
+                batch.scores[i] = [0.33, 0.34, 0.33]
+                batch.label_ids[i] = 1
+                blank.append(i)
+        if blank:
+            yield blank
+
+        if pending:
+            records = parse_market_batch([texts[i] for i in pending])
+            market_indices = [i for i, record in zip(pending, records) if record is not None]
+            if market_indices:
+                self._fill_scores(batch, market_indices, market_data_scores([record for record in records if record is not None]))
+                pending = [i for i, record in zip(pending, records) if record is None]
+                yield market_indices
+
+        if not pending:
+            return
+
+        self.wait_until_ready()
+        processed_texts = [self.preprocess_text(texts[i]) for i in pending]
+
+        cache_keys = []
+        if self.cache:
+            cache_keys = [SentimentCache.make_key(self.cache_model_id, self.model_revision, t) for t in processed_texts]
+            cached_scores = self.cache.get_many(cache_keys)
+            hits = [p for p, key in enumerate(cache_keys) if key in cached_scores]
+            if hits:
+                self._fill_scores(batch, [pending[p] for p in hits],
+                                  np.stack([cached_scores[cache_keys[p]] for p in hits]))
+                yield [pending[p] for p in hits]
+            misses = [p for p, key in enumerate(cache_keys) if key not in cached_scores]
+        else:
+            misses = list(range(len(pending)))
+
+        if not misses:
+            return
+
+        encoded_texts = self._tokenize([processed_texts[p] for p in misses])
+        failed = [pending[misses[m]] for m, ids in enumerate(encoded_texts) if ids is None]
+        if failed:
+            yield failed
+            misses = [p for p, ids in zip(misses, encoded_texts) if ids is not None]
+            encoded_texts = [ids for ids in encoded_texts if ids is not None]
+
+        lengths = [len(ids) for ids in encoded_texts]
+        for positions, padded_length in self.scheduler.schedule(lengths, batch_size):
+            batch_positions = [misses[m] for m in positions]
+            batch_indices = [pending[p] for p in batch_positions]
+
+            scores, scored = self._score_rows([encoded_texts[m] for m in positions], padded_length)
+            if scored:
+                self._fill_scores(batch, [batch_indices[k] for k in scored], scores)
+                if self.cache:
+                    self.cache.put_many({cache_keys[batch_positions[k]]: row for k, row in zip(scored, scores)})
+            yield batch_indices
+
+    def _stream_columnar(self, texts: List[str], batch_size: Optional[int] = None) -> Iterator[SentimentBatch]:
+        representatives, labels = self._cluster(texts)
+        members = [[] for _ in representatives]
+        for index, label in enumerate(labels):
+            members[label].append(index)
+
+        batch = SentimentBatch.empty([texts[i] for i in representatives])
+        for filled in self._fill_columnar(batch, batch_size):
+            rows = sorted(index for label in filled for index in members[label])
+            done = batch.take(labels[rows])
+            done.texts = [texts[i] for i in rows]
+            yield done
+
+    def analyze_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict[str, any]]:
+        return self.analyze_columnar(texts, batch_size).to_dicts()
+
+    def analyze_stream(self, texts: Iterable[str], chunk_size: Optional[int] = None,
+                       summary: Optional[RunningSentimentSummary] = None) -> Iterator[SentimentBatch]:
+        self.stream_summary = summary if summary is not None else RunningSentimentSummary()
+        chunk_size = chunk_size or self.batch_size * STREAM_CHUNK_BATCHES
+        texts = iter(texts)
+
+        while True:
+            chunk = list(itertools.islice(texts, chunk_size))
+            if not chunk:
+                return
+            for batch in self._stream_columnar(chunk):
+                self.stream_summary.update(batch)
+                yield batch
+
+    def get_stream_summary(self) -> Dict[str, any]:
+        return self.stream_summary.snapshot()
+
+    def get_padding_stats(self) -> Dict[str, float]:
+        return self.scheduler.get_padding_stats()
+
+    def get_dedup_stats(self) -> Dict[str, float]:
+        return self.deduplicator.get_stats() if self.deduplicator else {}
 
     def get_sentiment_summary(self, texts: List[str]) -> Dict[str, any]:
-        results = self.analyze_batch(texts)
-        
-        sentiment_counts = {"Positive": 0, "Neutral": 0, "Negative": 0}
-        total_confidence = 0
-        
-        for result in results:
-            sentiment = result["sentiment"]
-            if sentiment in sentiment_counts:
-                sentiment_counts[sentiment] += 1
-            total_confidence += result["confidence"]
-        
-        total_texts = len(results)
-        avg_confidence = total_confidence / total_texts if total_texts > 0 else 0
+        batch = self.analyze_columnar(texts)
         
+        sentiment_counts = batch.sentiment_distribution()
         dominant_sentiment = max(sentiment_counts, key=sentiment_counts.get)
         
         return {
-            "total_analyzed": total_texts,
+            "total_analyzed": len(batch),
             "sentiment_distribution": sentiment_counts,
             "dominant_sentiment": dominant_sentiment,
-            "average_confidence": avg_confidence,
-            "detailed_results": results
+            "average_confidence": batch.average_confidence(),
+            "detailed_results": batch
         }
@@ -0,0 +1,218 @@
+from typing import Dict, Iterator, List, Optional, Union
+import threading
+import numpy as np
+
+
+SENTIMENT_LABELS = ['Negative', 'Neutral', 'Positive']
+ERROR_LABEL_ID = len(SENTIMENT_LABELS)
+
+
+class SentimentBatch:
+    def __init__(self, texts: List[str], scores: np.ndarray, label_ids: np.ndarray, confidence: np.ndarray,
+                 sources: Optional[List[str]] = None, raw_scores: Optional[np.ndarray] = None,
+                 financial_bias: Optional[np.ndarray] = None, has_raw_scores: Optional[np.ndarray] = None,
+                 labels: List[str] = None):
+        self.texts = list(texts)
+        self.scores = np.asarray(scores, dtype=np.float64).reshape(len(self.texts), 3)
+        self.label_ids = np.asarray(label_ids, dtype=np.int8)
+        self.confidence = np.asarray(confidence, dtype=np.float64)
+        self.sources = list(sources) if sources is not None else None
+        self.raw_scores = raw_scores
+        self.financial_bias = financial_bias
+        self.has_raw_scores = has_raw_scores
+        self.labels = labels or SENTIMENT_LABELS
+
+    @classmethod
+    def empty(cls, texts: List[str], sources: Optional[List[str]] = None, enhanced: bool = False) -> "SentimentBatch":
+        size = len(texts)
+        return cls(
+            texts,
+            scores=np.zeros((size, 3)),
+            label_ids=np.full(size, ERROR_LABEL_ID, dtype=np.int8),
+            confidence=np.zeros(size),
+            sources=(sources if sources is not None else [None] * size) if enhanced else None,
+            raw_scores=np.zeros((size, 3)) if enhanced else None,
+            financial_bias=np.zeros((size, 3)) if enhanced else None,
+            has_raw_scores=np.zeros(size, dtype=bool) if enhanced else None
+        )
+
+    @classmethod
+    def concat(cls, batches: List["SentimentBatch"]) -> "SentimentBatch":
+        if not batches:
+            return cls([], np.zeros((0, 3)), np.zeros(0), np.zeros(0))
+
+        first = batches[0]
+        enhanced = first.financial_bias is not None
+        return cls(
+            [text for batch in batches for text in batch.texts],
+            scores=np.concatenate([batch.scores for batch in batches]),
+            label_ids=np.concatenate([batch.label_ids for batch in batches]),
+            confidence=np.concatenate([batch.confidence for batch in batches]),
+            sources=[source for batch in batches for source in batch.sources] if first.sources is not None else None,
+            raw_scores=np.concatenate([batch.raw_scores for batch in batches]) if enhanced else None,
+            financial_bias=np.concatenate([batch.financial_bias for batch in batches]) if enhanced else None,
+            has_raw_scores=np.concatenate([batch.has_raw_scores for batch in batches]) if enhanced else None,
+            labels=first.labels
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, any], "SentimentBatch"]:
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("SentimentBatch index out of range")
+        return self._row_dict(index)
+
+    def __iter__(self) -> Iterator[Dict[str, any]]:
+        for index in range(len(self)):
+            yield self._row_dict(index)
+
+    def take(self, indices: np.ndarray) -> "SentimentBatch":
+        indices = np.asarray(indices, dtype=np.int64)
+        enhanced = self.financial_bias is not None
+        return SentimentBatch(
+            [self.texts[i] for i in indices],
+            scores=self.scores[indices],
+            label_ids=self.label_ids[indices],
+            confidence=self.confidence[indices],
+            sources=[self.sources[i] for i in indices] if self.sources is not None else None,
+            raw_scores=self.raw_scores[indices] if enhanced else None,
+            financial_bias=self.financial_bias[indices] if enhanced else None,
+            has_raw_scores=self.has_raw_scores[indices] if enhanced else None,
+            labels=self.labels
+        )
+
+    def sentiment_names(self) -> List[str]:
+        names = self.labels + ["Error"]
+        return [names[label_id] for label_id in self.label_ids]
+
+    def _row_dict(self, index: int) -> Dict[str, any]:
+        label_id = int(self.label_ids[index])
+        result = {
+            "text": self.texts[index],
+            "sentiment": self.labels[label_id] if label_id != ERROR_LABEL_ID else "Error",
+            "confidence": float(self.confidence[index]),
+            "scores": {label: float(score) for label, score in zip(self.labels, self.scores[index])}
+        }
+
+        if self.financial_bias is not None:
+            bias_row = self.financial_bias[index]
+            result["financial_bias"] = {
+                "positive": float(bias_row[2]),
+                "negative": float(bias_row[0]),
+                "neutral": float(bias_row[1])
+            }
+            result["source"] = self.sources[index]
+            if self.has_raw_scores[index]:
+                result["raw_scores"] = {label: float(score) for label, score in zip(self.labels, self.raw_scores[index])}
+
+        return result
+
+    def to_dicts(self) -> List[Dict[str, any]]:
+        return list(self)
+
+    def sentiment_distribution(self) -> Dict[str, int]:
+        counts = np.bincount(self.label_ids, minlength=ERROR_LABEL_ID + 1)
+        return {"Positive": int(counts[2]), "Neutral": int(counts[1]), "Negative": int(counts[0])}
+
+    def average_confidence(self) -> float:
+        return float(self.confidence.mean()) if len(self) > 0 else 0
+
+    def financial_bias_summary(self) -> Dict[str, float]:
+        if self.financial_bias is None or len(self) == 0:
+            return {"positive": 0, "negative": 0, "neutral": 0}
+        means = self.financial_bias.mean(axis=0)
+        return {"positive": float(means[2]), "negative": float(means[0]), "neutral": float(means[1])}
+
+    def _source_codes(self):
+        sources = self.sources if self.sources is not None else [None] * len(self)
+        source_codes = {}
+        codes = np.fromiter((source_codes.setdefault(source, len(source_codes)) for source in sources),
+                            dtype=np.int64, count=len(sources))
+        return source_codes, codes
+
+    def group_by_source(self) -> Dict[str, "SentimentBatch"]:
+        source_codes, codes = self._source_codes()
+        order = np.argsort(codes, kind="stable")
+        boundaries = np.searchsorted(codes[order], np.arange(1, len(source_codes)))
+        groups = np.split(order, boundaries)
+        return {source: self.take(groups[code]) for source, code in source_codes.items()}
+
+    def source_breakdown(self) -> Dict[str, Dict[str, int]]:
+        source_codes, codes = self._source_codes()
+
+        width = ERROR_LABEL_ID + 1
+        counts = np.bincount(codes * width + self.label_ids, minlength=len(source_codes) * width)
+        counts = counts.reshape(len(source_codes), width)
+
+        breakdown = {}
+        for source, code in source_codes.items():
+            row = counts[code]
+            breakdown[source] = {
+                "Positive": int(row[2]),
+                "Neutral": int(row[1]),
+                "Negative": int(row[0]),
+                "total": int(row.sum())
+            }
+        return breakdown
+
+
+class RunningSentimentSummary:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.batches = 0
+        self.label_counts = np.zeros(ERROR_LABEL_ID + 1, dtype=np.int64)
+        self.confidence_total = 0.0
+        self.financial_bias_total = None
+        self.source_counts = {}
+
+    def update(self, batch: SentimentBatch):
+        label_counts = np.bincount(batch.label_ids, minlength=ERROR_LABEL_ID + 1)
+        source_breakdown = batch.source_breakdown() if batch.sources is not None else {}
+
+        with self._lock:
+            self.total += len(batch)
+            self.batches += 1
+            self.label_counts += label_counts
+            self.confidence_total += float(batch.confidence.sum())
+
+            if batch.financial_bias is not None:
+                if self.financial_bias_total is None:
+                    self.financial_bias_total = np.zeros(3)
+                self.financial_bias_total += batch.financial_bias.sum(axis=0)
+
+            for source, counts in source_breakdown.items():
+                totals = self.source_counts.setdefault(source, {"Positive": 0, "Neutral": 0, "Negative": 0, "total": 0})
+                for key, value in counts.items():
+                    totals[key] += value
+
+    def snapshot(self) -> Dict[str, any]:
+        with self._lock:
+            sentiment_counts = {
+                "Positive": int(self.label_counts[2]),
+                "Neutral": int(self.label_counts[1]),
+                "Negative": int(self.label_counts[0])
+            }
+            summary = {
+                "total_analyzed": self.total,
+                "sentiment_distribution": sentiment_counts,
+                "dominant_sentiment": max(sentiment_counts, key=sentiment_counts.get),
+                "average_confidence": self.confidence_total / self.total if self.total > 0 else 0,
+                "batches": self.batches
+            }
+
+            if self.financial_bias_total is not None:
+                means = self.financial_bias_total / self.total if self.total > 0 else self.financial_bias_total
+                summary["source_breakdown"] = {source: dict(counts) for source, counts in self.source_counts.items()}
+                summary["financial_bias_summary"] = {
+                    "positive": float(means[2]),
+                    "negative": float(means[0]),
+                    "neutral": float(means[1])
+                }
+
+        return summary
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+import multiprocessing
+import numpy as np
+
+
+DEFAULT_CORPUS_PATH = Path(__file__).parent / "benchmark_data" / "headlines.txt"
+ANALYZERS = ["sentiment", "enhanced"]
+
+
+def load_corpus(path: Optional[str] = None, limit: Optional[int] = None) -> List[str]:
+    with open(path or DEFAULT_CORPUS_PATH, encoding="utf-8") as corpus_file:
+        texts = [line.strip() for line in corpus_file if line.strip()]
+    return texts[:limit] if limit else texts
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_configuration(config: Dict, texts: List[str], offline: bool = True) -> Dict:
+    if offline:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        os.environ["TRANSFORMERS_OFFLINE"] = "1"
+    os.environ["OMP_NUM_THREADS"] = str(config["threads"])
+
+    from sentiment import SentimentAnalyzer
+    from enhanced_sentiment import EnhancedSentimentAnalyzer
+
+    analyzer_class = EnhancedSentimentAnalyzer if config["analyzer"] == "enhanced" else SentimentAnalyzer
+    result = dict(config)
+    start = time.perf_counter()
+    try:
+        analyzer = analyzer_class(config["model"], batch_size=config["batch_size"], backend=config["backend"],
+                                  precision=config["precision"], num_threads=config["threads"])
+    except (ImportError, ValueError, OSError) as e:
+        result["skipped"] = str(e)
+        return result
+    result["load_seconds"] = time.perf_counter() - start
+
+    batch_size = config["batch_size"]
+    batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+    analyzer.analyze_columnar(batches[0])
+
+    latencies = []
+    total_start = time.perf_counter()
+    for batch in batches:
+        batch_start = time.perf_counter()
+        analyzer.analyze_columnar(batch)
+        latencies.append(time.perf_counter() - batch_start)
+    total_seconds = time.perf_counter() - total_start
+
+    latencies_ms = np.array(latencies) * 1000
+    result.update({
+        "items": len(texts),
+        "batches": len(batches),
+        "seconds": total_seconds,
+        "items_per_second": len(texts) / total_seconds if total_seconds > 0 else 0.0,
+        "batch_latency_ms": {
+            "mean": float(latencies_ms.mean()),
+            "p50": float(np.percentile(latencies_ms, 50)),
+            "p95": float(np.percentile(latencies_ms, 95)),
+            "p99": float(np.percentile(latencies_ms, 99))
+        },
+        "padding_efficiency": analyzer.get_padding_stats().get("padding_efficiency"),
+        "peak_rss_mb": peak_rss_mb()
+    })
+    analyzer.close()
+    return result
+
+
+def run_benchmark(model_name: str, texts: List[str], analyzers: List[str], batch_sizes: List[int], threads: List[int],
+                  backends: List[str], precision: str = "fp32", offline: bool = True, isolate: bool = True) -> Dict:
+    import transformers
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "transformers": transformers.__version__,
+            "model": model_name,
+            "corpus_items": len(texts),
+            "offline": offline
+        },
+        "results": []
+    }
+
+    for analyzer, backend, batch_size, num_threads in itertools.product(analyzers, backends, batch_sizes, threads):
+        config = {
+            "analyzer": analyzer,
+            "model": model_name,
+            "backend": backend,
+            "precision": precision,
+            "batch_size": batch_size,
+            "threads": num_threads
+        }
+        if isolate:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_configuration, config, texts, offline).result()
+        else:
+            result = run_configuration(config, texts, offline)
+        report["results"].append(result)
+
+    return report
+
+
+def _result_key(result: Dict) -> tuple:
+    return (result["analyzer"], result["backend"], result["precision"], result["batch_size"], result["threads"])
+
+
+def find_regressions(report: Dict, baseline: Dict, tolerance: float = 0.1) -> List[Dict]:
+    baseline_results = {_result_key(result): result for result in baseline.get("results", []) if "skipped" not in result}
+    regressions = []
+
+    for result in report["results"]:
+        previous = baseline_results.get(_result_key(result))
+        if "skipped" in result or previous is None:
+            continue
+
+        checks = [
+            ("items_per_second", result["items_per_second"], previous["items_per_second"], -1),
+            ("p95_batch_latency_ms", result["batch_latency_ms"]["p95"], previous["batch_latency_ms"]["p95"], 1)
+        ]
+        for metric, current, before, direction in checks:
+            if before and direction * (current - before) / before > tolerance:
+                regressions.append({
+                    "configuration": dict(zip(["analyzer", "backend", "precision", "batch_size", "threads"],
+                                              _result_key(result))),
+                    "metric": metric,
+                    "baseline": before,
+                    "current": current
+                })
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentiment inference throughput and latency")
+    parser.add_argument("--model", default="cardiffnlp/twitter-roberta-base-sentiment",
+                        help="Model name or local path; must already be in the local Hugging Face cache when offline")
+    parser.add_argument("--corpus", help=f"Headline file, one per line (default: {DEFAULT_CORPUS_PATH.name})")
+    parser.add_argument("--items", type=int, help="Only use the first N headlines of the corpus")
+    parser.add_argument("--analyzers", nargs="+", default=ANALYZERS, choices=ANALYZERS)
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[8, 32, 64])
+    parser.add_argument("--threads", nargs="+", type=int, default=[os.cpu_count() or 1])
+    parser.add_argument("--backends", nargs="+", default=["torch"])
+    parser.add_argument("--precision", default="fp32")
+    parser.add_argument("--online", action="store_true", help="Allow downloading the model from the Hugging Face Hub")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="Run every configuration in this process (faster, but load time and peak RSS are shared)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Allowed relative throughput drop or p95 latency increase before flagging a regression")
+    args = parser.parse_args()
+
+    if not args.online:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+    texts = load_corpus(args.corpus, args.items)
+    report = run_benchmark(args.model, texts, args.analyzers, args.batch_sizes, args.threads, args.backends,
+                           args.precision, offline=not args.online, isolate=not args.no_isolate)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            regressions = find_regressions(report, json.load(baseline_file), args.tolerance)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output + "\n")
+    else:
+        print(output)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
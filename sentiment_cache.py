@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "twsm", "sentiment_cache.sqlite")
+
+
+def model_fingerprint(config, tokenizer) -> str:
+    commit_hash = getattr(config, "_commit_hash", None) or getattr(tokenizer, "_commit_hash", None)
+    if commit_hash:
+        return commit_hash
+
+    config_json = config.to_json_string(use_diff=False)
+    digest = hashlib.sha256(config_json.encode("utf-8"))
+    digest.update(str(len(tokenizer)).encode("utf-8"))
+    return f"local-{digest.hexdigest()[:16]}"
+
+
+class SentimentCache:
+    def __init__(self, db_path: Optional[str] = DEFAULT_CACHE_PATH, max_memory_items: int = 10000,
+                 max_disk_items: int = 200000, max_age_seconds: float = 7 * 24 * 3600):
+        self.db_path = db_path
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self.max_age_seconds = max_age_seconds
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.connection = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._open()
+
+    def _open(self):
+        if not self.db_path:
+            return
+        try:
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                "key TEXT PRIMARY KEY, model_name TEXT, negative REAL, neutral REAL, positive REAL, created_at REAL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sentiment_cache_created ON sentiment_cache (created_at)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_models (model_name TEXT PRIMARY KEY, revision TEXT)"
+            )
+            self.connection.commit()
+            self.prune()
+        except sqlite3.Error as e:
+            print(f"Warning: sentiment cache disabled on disk ({e})")
+            self.connection = None
+
+    @staticmethod
+    def make_key(model_name: str, revision: str, processed_text: str) -> str:
+        text_hash = hashlib.sha256(processed_text.encode("utf-8")).hexdigest()
+        return f"{model_name}|{revision}|{text_hash}"
+
+    def register_model(self, model_name: str, revision: str):
+        with self.lock:
+            stale = [key for key in self.memory if key.startswith(f"{model_name}|") and not key.startswith(f"{model_name}|{revision}|")]
+            for key in stale:
+                del self.memory[key]
+            self.stats["evictions"] += len(stale)
+
+            if not self.connection:
+                return
+            try:
+                row = self.connection.execute(
+                    "SELECT revision FROM cache_models WHERE model_name = ?", (model_name,)
+                ).fetchone()
+                if row and row[0] != revision:
+                    cursor = self.connection.execute("DELETE FROM sentiment_cache WHERE model_name = ?", (model_name,))
+                    self.stats["evictions"] += max(cursor.rowcount, 0)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO cache_models (model_name, revision) VALUES (?, ?)", (model_name, revision)
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: sentiment cache error: {e}")
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        now = time.time()
+        with self.lock:
+            disk_lookup = []
+            for key in keys:
+                entry = self.memory.get(key)
+                if entry is not None and now - entry[1] <= self.max_age_seconds:
+                    self.memory.move_to_end(key)
+                    found[key] = entry[0]
+                    self.stats["memory_hits"] += 1
+                elif key not in found:
+                    disk_lookup.append(key)
+
+            if disk_lookup and self.connection:
+                rows = []
+                try:
+                    for start in range(0, len(disk_lookup), 500):
+                        chunk = disk_lookup[start:start + 500]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows.extend(self.connection.execute(
+                            f"SELECT key, negative, neutral, positive, created_at FROM sentiment_cache "
+                            f"WHERE key IN ({placeholders}) AND created_at >= ?",
+                            (*chunk, now - self.max_age_seconds)
+                        ).fetchall())
+                except sqlite3.Error as e:
+                    print(f"Warning: sentiment cache error: {e}")
+
+                for key, negative, neutral, positive, created_at in rows:
+                    scores = np.array([negative, neutral, positive])
+                    found[key] = scores
+                    self._remember(key, scores, created_at)
+                    self.stats["disk_hits"] += 1
+
+            self.stats["misses"] += sum(1 for key in set(disk_lookup) if key not in found)
+
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        if not items:
+            return
+        now = time.time()
+        with self.lock:
+            for key, scores in items.items():
+                self._remember(key, np.asarray(scores, dtype=float), now)
+            self.stats["writes"] += len(items)
+
+            if not self.connection:
+                return
+            try:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache (key, model_name, negative, neutral, positive, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(key, key.split("|", 1)[0], float(scores[0]), float(scores[1]), float(scores[2]), now)
+                     for key, scores in items.items()]
+                )
+                self.connection.commit()
+                self._evict_disk_overflow()
+            except sqlite3.Error as e:
+                print(f"Warning: sentiment cache error: {e}")
+
+    def _remember(self, key: str, scores: np.ndarray, created_at: float):
+        self.memory[key] = (scores, created_at)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_items:
+            self.memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _evict_disk_overflow(self):
+        count = self.connection.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0]
+        overflow = count - self.max_disk_items
+        if overflow > 0:
+            self.connection.execute(
+                "DELETE FROM sentiment_cache WHERE key IN "
+                "(SELECT key FROM sentiment_cache ORDER BY created_at ASC LIMIT ?)", (overflow,)
+            )
+            self.connection.commit()
+            self.stats["evictions"] += overflow
+
+    def prune(self):
+        cutoff = time.time() - self.max_age_seconds
+        with self.lock:
+            expired = [key for key, (_, created_at) in self.memory.items() if created_at < cutoff]
+            for key in expired:
+                del self.memory[key]
+            self.stats["evictions"] += len(expired)
+
+            if not self.connection:
+                return
+            try:
+                cursor = self.connection.execute("DELETE FROM sentiment_cache WHERE created_at < ?", (cutoff,))
+                self.connection.commit()
+                self.stats["evictions"] += max(cursor.rowcount, 0)
+                self._evict_disk_overflow()
+            except sqlite3.Error as e:
+                print(f"Warning: sentiment cache error: {e}")
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            if not self.connection:
+                return
+            try:
+                self.connection.execute("DELETE FROM sentiment_cache")
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: sentiment cache error: {e}")
+
+    def get_stats(self) -> Dict[str, float]:
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hits": hits,
+            "hit_rate": hits / lookups if lookups > 0 else 0.0,
+            "memory_items": len(self.memory)
+        }
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,49 @@
+from collections import defaultdict, deque
+from typing import Callable, Dict, List
+import numpy as np
+from rich.console import Console, Group
+from rich.live import Live
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
+from rich.table import Table
+from sentiment_batch import SentimentBatch
+
+
+class LiveRows:
+    def __init__(self, create_table: Callable[[List[Dict]], Table]):
+        self.create_table = create_table
+        self.rows = []
+
+    def __rich__(self) -> Table:
+        return self.create_table(list(self.rows))
+
+
+def input_order(texts: List[str], batch: SentimentBatch) -> np.ndarray:
+    positions = defaultdict(deque)
+    for position, text in enumerate(texts):
+        positions[text].append(position)
+    return np.argsort([positions[text].popleft() for text in batch.texts], kind="stable")
+
+
+def stream_sentiment(console: Console, analyzer, texts: List[str], description: str,
+                     create_table: Callable[[List[Dict]], Table], refresh_per_second: float = 4) -> Dict:
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+    )
+    task = progress.add_task(description, total=len(texts))
+    live_rows = LiveRows(create_table)
+    batches = []
+
+    with Live(Group(progress, live_rows), console=console, refresh_per_second=refresh_per_second, transient=True):
+        for batch in analyzer.analyze_stream(texts):
+            batches.append(batch)
+            live_rows.rows.extend(batch)
+            progress.advance(task, len(batch))
+
+    results = SentimentBatch.concat(batches)
+    summary = analyzer.get_stream_summary()
+    summary["detailed_results"] = results.take(input_order(texts, results)) if len(results) else results
+    return summary